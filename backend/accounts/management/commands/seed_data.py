@@ -14,8 +14,8 @@ from accounts.models import (
     ResumeLink,
 )
 from applications.models import Application
-from matching.engine import MatchingEngine, normalize_skills
-from matching.models import Match
+from matching.skills import normalize_skills
+from matching.services import match_projects
 from projects.models import Project
 
 
@@ -243,17 +243,6 @@ class Command(BaseCommand):
                     proposed_rate=Decimal("30.00"),
                 )
 
-            engine = MatchingEngine()
-            for project in created_projects:
-                matches = engine.match_project_to_freelancers(project, freelancer_profiles)
-                for item in matches:
-                    Match.objects.update_or_create(
-                        project=project,
-                        freelancer_id=item["freelancer_id"],
-                        defaults={
-                            "match_score": item["score"],
-                            "matched_skills": item["matched_skills"],
-                        },
-                    )
+            match_projects(created_projects)
 
         self.stdout.write(self.style.SUCCESS("Seed data created/updated successfully."))
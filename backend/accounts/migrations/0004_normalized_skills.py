@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:24
+
+import re
+
+from django.db import migrations, models
+
+# Frozen copy of matching.skills.normalize_skills, so later edits there cannot change history.
+SKILL_MAP = {
+    "reactjs": "react",
+    "react.js": "react",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "typescript": "typescript",
+    "js": "javascript",
+    "py": "python",
+}
+NON_SKILL_CHARS = re.compile(r"[^a-z0-9.+#]")
+
+
+def normalize_skills(skills):
+    normalized = set()
+    for skill in skills or []:
+        if skill:
+            cleaned = NON_SKILL_CHARS.sub("", skill.lower().strip())
+            normalized.add(SKILL_MAP.get(cleaned, cleaned))
+    normalized.discard("")
+    return sorted(normalized)
+
+
+def backfill_normalized_skills(apps, schema_editor):
+    FreelancerProfile = apps.get_model('accounts', 'FreelancerProfile')
+    rows = list(FreelancerProfile.objects.only('id', 'skills'))
+    for row in rows:
+        row.normalized_skills = normalize_skills(row.skills)
+    FreelancerProfile.objects.bulk_update(rows, ['normalized_skills'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_resume_resumelink_resumeexperience_resumeeducation_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='freelancerprofile',
+            name='normalized_skills',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(backfill_normalized_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_freelancer_skills(apps, schema_editor):
+    Skill = apps.get_model('accounts', 'Skill')
+    FreelancerProfile = apps.get_model('accounts', 'FreelancerProfile')
+    Link = apps.get_model('accounts', 'FreelancerSkill')
+    rows = list(FreelancerProfile.objects.values_list('id', 'normalized_skills'))
+    # Skills longer than Skill.name allows were never length-checked; they get no link.
+    names = {name for _, skills in rows for name in skills if len(name) <= 100}
+    Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+    skill_ids = dict(Skill.objects.values_list('name', 'id'))
+    Link.objects.bulk_create(
+        [
+            Link(freelancer_id=owner_id, skill_id=skill_ids[name])
+            for owner_id, skills in rows
+            for name in set(skills)
+            if name in names
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_normalized_skills'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FreelancerSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('freelancer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='accounts.freelancerprofile')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='freelancer_links', to='accounts.skill')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'freelancer'], name='freelancer_skill_lookup_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='freelancerskill',
+            constraint=models.UniqueConstraint(fields=('freelancer', 'skill'), name='unique_freelancer_skill'),
+        ),
+        migrations.RunPython(backfill_freelancer_skills, migrations.RunPython.noop),
+    ]
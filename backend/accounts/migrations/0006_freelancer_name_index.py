@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_skills'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='freelancerprofile',
+            index=models.Index(fields=['name', 'id'], name='freelancer_name_idx'),
+        ),
+    ]
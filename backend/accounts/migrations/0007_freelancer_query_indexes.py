@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:47
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_freelancer_name_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='freelancerprofile',
+            index=models.Index(django.db.models.functions.text.Lower('experience_level'), models.F('name'), models.F('id'), name='freelancer_level_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='freelancerprofile',
+            index=models.Index(fields=['hourly_rate'], name='freelancer_rate_idx'),
+        ),
+    ]
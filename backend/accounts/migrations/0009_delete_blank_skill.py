@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:40
+
+from django.db import migrations
+
+
+def delete_blank_skill(apps, schema_editor):
+    # Blank entries used to normalize to "", which saves then linked like a real skill.
+    Skill = apps.get_model('accounts', 'Skill')
+    Skill.objects.filter(name='').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_profile_updated_at'),
+        ('projects', '0005_project_skills'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_blank_skill, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,11 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Count, F
+from django.db.models.functions import Lower
+from matching.skills import normalize_skills
+
+# Skill names are stored in Skill.name, so serializers reject longer skills up front.
+SKILL_NAME_MAX_LENGTH = 100
 
 
 class User(AbstractUser):
@@ -13,6 +19,60 @@ class User(AbstractUser):
     REQUIRED_FIELDS = ["email"]
 
 
+class SkillManager(models.Manager):
+    def ids_for(self, names):
+        names = list(names)
+        if not names:
+            return {}
+        self.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+        return dict(self.filter(name__in=names).values_list("name", "id"))
+
+
+class Skill(models.Model):
+    """One row per normalized skill name, shared by freelancers and projects."""
+
+    name = models.CharField(max_length=SKILL_NAME_MAX_LENGTH, unique=True)
+
+    objects = SkillManager()
+
+    def __str__(self):
+        return self.name
+
+
+def sync_skill_links(link_model, owner_field, owner_id, names):
+    """Make ``link_model`` rows for one owner match the skill ``names`` exactly.
+
+    Names longer than ``Skill.name`` allows (stored before the limit existed) get no link.
+    """
+    names = [name for name in names if len(name) <= SKILL_NAME_MAX_LENGTH]
+    skill_ids = set(Skill.objects.ids_for(names).values())
+    links = link_model.objects.filter(**{owner_field: owner_id})
+    links.exclude(skill_id__in=skill_ids).delete()
+    existing = set(links.values_list("skill_id", flat=True))
+    link_model.objects.bulk_create(
+        [
+            link_model(**{owner_field: owner_id, "skill_id": skill_id})
+            for skill_id in skill_ids - existing
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def filter_by_skills(queryset, link_model, owner_field, names, match="all"):
+    """Restrict ``queryset`` to owners linked to all (or any) of the skill ``names``."""
+    names = list(names)
+    if not names:
+        return queryset
+    links = link_model.objects.filter(skill__name__in=names)
+    if match == "all":
+        links = (
+            links.values(owner_field)
+            .annotate(matched=Count("skill_id"))
+            .filter(matched=len(names))
+        )
+    return queryset.filter(id__in=links.values(owner_field))
+
+
 class FreelancerProfile(models.Model):
     class ExperienceLevel(models.TextChoices):
         JUNIOR = "Junior", "Junior"
@@ -22,6 +82,7 @@ class FreelancerProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="freelancer_profile")
     name = models.CharField(max_length=255)
     skills = models.JSONField(default=list, blank=True)
+    normalized_skills = models.JSONField(default=list, blank=True, editable=False)
     experience_level = models.CharField(
         max_length=20, choices=ExperienceLevel.choices, default=ExperienceLevel.MID
     )
@@ -29,15 +90,54 @@ class FreelancerProfile(models.Model):
     bio = models.TextField(blank=True)
     portfolio_links = models.JSONField(default=list, blank=True)
     rating = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of the directory walks (name, id).
+            models.Index(fields=["name", "id"], name="freelancer_name_idx"),
+            # The directory filters experience level as LOWER(experience_level) = LOWER(%s).
+            models.Index(
+                Lower("experience_level"), F("name"), F("id"), name="freelancer_level_name_idx"
+            ),
+            models.Index(fields=["hourly_rate"], name="freelancer_rate_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.normalized_skills = normalize_skills(self.skills)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            extra = {"updated_at"}
+            if "skills" in update_fields:
+                extra.add("normalized_skills")
+            kwargs["update_fields"] = {*update_fields, *extra}
+        super().save(*args, **kwargs)
+        if update_fields is None or "skills" in update_fields:
+            sync_skill_links(FreelancerSkill, "freelancer_id", self.pk, self.normalized_skills)
 
     def __str__(self):
         return f"{self.name} ({self.user.email})"
 
 
+class FreelancerSkill(models.Model):
+    freelancer = models.ForeignKey(
+        FreelancerProfile, on_delete=models.CASCADE, related_name="skill_links"
+    )
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="freelancer_links")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["freelancer", "skill"], name="unique_freelancer_skill")
+        ]
+        # Skill filters look owners up by skill, so the skill column leads.
+        indexes = [models.Index(fields=["skill", "freelancer"], name="freelancer_skill_lookup_idx")]
+
+
 class ClientProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="client_profile")
     company_name = models.CharField(max_length=255, blank=True, default="Independent")
     name = models.CharField(max_length=255)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.company_name} - {self.name}"
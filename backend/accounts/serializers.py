@@ -3,6 +3,7 @@ from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 from .models import (
+    SKILL_NAME_MAX_LENGTH,
     FreelancerProfile,
     ClientProfile,
     Resume,
@@ -45,6 +46,9 @@ class UserUpdateSerializer(serializers.ModelSerializer):
 
 class FreelancerProfileSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
+    skills = serializers.ListField(
+        child=serializers.CharField(max_length=SKILL_NAME_MAX_LENGTH), required=False
+    )
 
     class Meta:
         model = FreelancerProfile
@@ -149,7 +153,9 @@ class RegisterSerializer(serializers.Serializer):
     name = serializers.CharField(required=False, allow_blank=True)
     company_name = serializers.CharField(required=False, allow_blank=True)
 
-    skills = serializers.ListField(child=serializers.CharField(), required=False)
+    skills = serializers.ListField(
+        child=serializers.CharField(max_length=SKILL_NAME_MAX_LENGTH), required=False
+    )
     experience_level = serializers.ChoiceField(
         choices=FreelancerProfile.ExperienceLevel.choices,
         required=False,
@@ -1,19 +1,25 @@
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
 from django.shortcuts import get_object_or_404
 from rest_framework import permissions, status, viewsets
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
+from matching.skills import normalize_skills
+from skillsync.conditional import conditional_get
+from skillsync.pagination import NameKeysetPagination
 from .models import (
     FreelancerProfile,
+    FreelancerSkill,
     ClientProfile,
     Resume,
     ResumeExperience,
     ResumeEducation,
     ResumeCertification,
     ResumeLink,
+    filter_by_skills,
 )
 from .serializers import (
     RegisterSerializer,
@@ -48,6 +54,11 @@ def _normalize_list(values, lower=False):
     return cleaned
 
 
+def _profile_validators(user, profile):
+    # User fields are already loaded; profile saves (including MeView PUTs) bump updated_at.
+    return ("profile", user.pk, user.username, user.email, user.role, profile.pk, profile.updated_at)
+
+
 def _get_resume_for_user(user):
     if user.role != User.Role.FREELANCER:
         raise PermissionDenied("Only freelancers can access resumes")
@@ -117,12 +128,15 @@ class MeView(APIView):
         )
         if not profile:
             return Response({"detail": "Profile not found"}, status=404)
-        if user.role == User.Role.FREELANCER:
-            profile_serializer = FreelancerProfileSerializer(profile)
-        else:
-            profile_serializer = ClientProfileSerializer(profile)
 
-        return Response({"user": UserSerializer(user).data, "profile": profile_serializer.data})
+        def respond():
+            if user.role == User.Role.FREELANCER:
+                profile_serializer = FreelancerProfileSerializer(profile)
+            else:
+                profile_serializer = ClientProfileSerializer(profile)
+            return Response({"user": UserSerializer(user).data, "profile": profile_serializer.data})
+
+        return conditional_get(request, _profile_validators(user, profile), profile.updated_at, respond)
 
     def put(self, request):
         user = request.user
@@ -192,16 +206,18 @@ class ProfileDetailView(APIView):
         user = get_object_or_404(User, id=user_id)
         if user.role == User.Role.FREELANCER:
             profile = getattr(user, "freelancer_profile", None)
-            if not profile:
-                return Response({"detail": "Profile not found"}, status=404)
-            serializer = FreelancerProfileSerializer(profile)
+            serializer_class = FreelancerProfileSerializer
         else:
             profile = getattr(user, "client_profile", None)
-            if not profile:
-                return Response({"detail": "Profile not found"}, status=404)
-            serializer = ClientProfileSerializer(profile)
+            serializer_class = ClientProfileSerializer
+        if not profile:
+            return Response({"detail": "Profile not found"}, status=404)
+
+        def respond():
+            serializer = serializer_class(profile)
+            return Response({"user": UserSerializer(user).data, "profile": serializer.data})
 
-        return Response({"user": UserSerializer(user).data, "profile": serializer.data})
+        return conditional_get(request, _profile_validators(user, profile), profile.updated_at, respond)
 
     def put(self, request, user_id):
         if request.user.id != user_id and not request.user.is_staff:
@@ -229,8 +245,13 @@ class ResumeMeView(APIView):
 
     def get(self, request):
         resume = _get_resume_for_user(request.user)
-        serializer = ResumeDetailSerializer(resume)
-        return Response(serializer.data)
+        # Child row changes bump Resume.updated_at (see matching.signals).
+        return conditional_get(
+            request,
+            ("resume", resume.pk, resume.updated_at),
+            resume.updated_at,
+            lambda: Response(ResumeDetailSerializer(resume).data),
+        )
 
     def put(self, request):
         resume = _get_resume_for_user(request.user)
@@ -292,6 +313,7 @@ class ResumeLinkViewSet(viewsets.ModelViewSet):
 class FreelancerViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = FreelancerProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NameKeysetPagination
 
     def get_queryset(self):
         qs = FreelancerProfile.objects.select_related("user").all().order_by("name")
@@ -299,12 +321,16 @@ class FreelancerViewSet(viewsets.ReadOnlyModelViewSet):
 
         skills = params.get("skills")
         if skills:
-            for skill in [s.strip().lower() for s in skills.split(",") if s.strip()]:
-                qs = qs.filter(skills__contains=[skill])
+            match = "any" if params.get("skills_match") == "any" else "all"
+            qs = filter_by_skills(
+                qs, FreelancerSkill, "freelancer_id", normalize_skills(skills.split(",")), match=match
+            )
 
         experience = params.get("experience_level")
         if experience:
-            qs = qs.filter(experience_level__iexact=experience)
+            qs = qs.alias(level_lower=Lower("experience_level")).filter(
+                level_lower=Lower(Value(experience))
+            )
 
         rate_min = params.get("hourly_rate_min")
         rate_max = params.get("hourly_rate_max")
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_application_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['project', '-created_at', '-id'], name='application_project_idx'),
+        ),
+    ]
@@ -16,5 +16,16 @@ class Application(models.Model):
     status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination walks (created_at, id) newest first.
+            models.Index(fields=["-created_at", "-id"], name="application_created_idx"),
+            models.Index(
+                fields=["freelancer", "-created_at", "-id"], name="application_freelancer_idx"
+            ),
+            # Clients list applications through their projects.
+            models.Index(fields=["project", "-created_at", "-id"], name="application_project_idx"),
+        ]
+
     def __str__(self):
         return f"{self.freelancer.name} -> {self.project.title}"
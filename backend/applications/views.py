@@ -1,6 +1,7 @@
 from rest_framework import permissions, viewsets, status
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
+from skillsync.pagination import KeysetPagination
 from .models import Application
 from .serializers import ApplicationSerializer
 
@@ -8,6 +9,7 @@ from .serializers import ApplicationSerializer
 class ApplicationViewSet(viewsets.ModelViewSet):
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         user = self.request.user
@@ -1,4 +1,6 @@
 from django.contrib import admin
-from .models import Match
+from .models import FreelancerDocument, Match, MatchJob
 
 admin.site.register(Match)
+admin.site.register(FreelancerDocument)
+admin.site.register(MatchJob)
@@ -0,0 +1,102 @@
+import time
+from collections import defaultdict
+
+from .engine import top_n_indices
+from .lazy import np
+
+
+class RandomProjectionLSH:
+    """Random-hyperplane LSH over L2-normalised TF-IDF rows.
+
+    Each of ``n_tables`` tables hashes a vector to ``n_bits`` sign bits, so
+    vectors with a small angle between them tend to share a bucket. More
+    tables or a probe radius of 1 raise recall at the cost of more candidates.
+    """
+
+    def __init__(self, n_features, n_tables=16, n_bits=10, seed=0):
+        rng = np.random.default_rng(seed)
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.planes = rng.standard_normal((n_features, n_tables * n_bits)).astype(np.float32)
+        self._bit_weights = np.left_shift(1, np.arange(n_bits, dtype=np.int64))
+        self._tables = [defaultdict(set) for _ in range(n_tables)]
+        self._keys = {}
+
+    def _hash(self, matrix):
+        projected = np.asarray(matrix @ self.planes)
+        bits = (projected > 0).reshape(-1, self.n_tables, self.n_bits)
+        return bits.astype(np.int64) @ self._bit_weights
+
+    def add(self, freelancer_ids, matrix):
+        if not len(freelancer_ids):
+            return
+        for fid, keys in zip(freelancer_ids, self._hash(matrix)):
+            self._discard(fid)
+            self._keys[fid] = tuple(int(key) for key in keys)
+            for table, key in zip(self._tables, self._keys[fid]):
+                table[key].add(fid)
+
+    def _discard(self, freelancer_id):
+        for table, key in zip(self._tables, self._keys.pop(freelancer_id, ())):
+            bucket = table.get(key)
+            if bucket is not None:
+                bucket.discard(freelancer_id)
+                if not bucket:
+                    del table[key]
+
+    def remove(self, freelancer_ids):
+        for fid in freelancer_ids:
+            self._discard(fid)
+
+    def query(self, vector, probe_radius=0):
+        candidates = set()
+        for table, key in zip(self._tables, self._hash(vector)[0]):
+            key = int(key)
+            candidates.update(table.get(key, ()))
+            if probe_radius >= 1:
+                for bit in range(self.n_bits):
+                    candidates.update(table.get(key ^ (1 << bit), ()))
+        return candidates
+
+
+def measure_recall(index, query_matrix, k=20, probe_radius=None):
+    """Compare ANN candidates against exact cosine top-k for each query row."""
+    recalls = []
+    candidate_counts = []
+    exact_seconds = 0.0
+    ann_seconds = 0.0
+    rows = index.rows
+    ids = np.asarray(rows.freelancer_ids)
+
+    for row in range(query_matrix.shape[0]):
+        query = query_matrix[row]
+
+        started = time.perf_counter()
+        exact_scores = (rows.matrix @ query.T).toarray().ravel()
+        top = top_n_indices(exact_scores, k)
+        # Rows with zero similarity are not neighbours, only padding.
+        exact = set(ids[top[exact_scores[top] > 0]])
+        exact_seconds += time.perf_counter() - started
+
+        started = time.perf_counter()
+        candidates = list(index.ann_candidates(query, probe_radius))
+        approx = set()
+        if candidates:
+            candidate_scores = (index.vectors_for(candidates) @ query.T).toarray().ravel()
+            approx = {candidates[pos] for pos in top_n_indices(candidate_scores, k)}
+        ann_seconds += time.perf_counter() - started
+
+        candidate_counts.append(len(candidates))
+        if exact:
+            recalls.append(len(exact & approx) / len(exact))
+
+    queries = max(query_matrix.shape[0], 1)
+    return {
+        "queries": query_matrix.shape[0],
+        "k": k,
+        "recall": float(np.mean(recalls)) if recalls else 1.0,
+        "mean_candidates": float(np.mean(candidate_counts)) if candidate_counts else 0.0,
+        "pool_size": len(ids),
+        "exact_ms": exact_seconds * 1000 / queries,
+        "ann_ms": ann_seconds * 1000 / queries,
+    }
@@ -0,0 +1,97 @@
+import json
+import os
+import shutil
+import time
+from datetime import datetime
+
+from .engine import build_vectorizer
+from .lazy import np, sparse
+
+ARTIFACT_FORMAT = 1
+ARRAYS = ("terms", "idf", "data", "indices", "indptr", "freelancer_ids")
+
+
+def save_index_artifact(index, path):
+    """Write ``index`` as plain ``.npy`` arrays plus a JSON manifest under ``path``."""
+    os.makedirs(path)
+    rows = index.rows
+    vocabulary = index.vectorizer.vocabulary_
+    arrays = {
+        "terms": np.array(sorted(vocabulary, key=vocabulary.get)),
+        "idf": index.vectorizer.idf_,
+        "data": rows.matrix.data,
+        "indices": rows.matrix.indices,
+        "indptr": rows.matrix.indptr,
+        "freelancer_ids": np.asarray(rows.freelancer_ids, dtype=np.int64),
+    }
+    for name, array in arrays.items():
+        np.save(os.path.join(path, f"{name}.npy"), array, allow_pickle=False)
+
+    skills = [list(index._skills.get(fid, ())) for fid in rows.freelancer_ids]
+    with open(os.path.join(path, "skills.json"), "w", encoding="utf-8") as handle:
+        json.dump(skills, handle)
+    manifest = {
+        "format": ARTIFACT_FORMAT,
+        "shape": list(rows.matrix.shape),
+        "synced_at": index.synced_at.isoformat() if index.synced_at else None,
+    }
+    with open(os.path.join(path, "manifest.json"), "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle)
+
+
+def load_index_artifact(path):
+    """Rebuild a FreelancerIndex whose matrix is memory-mapped read-only from ``path``.
+
+    Every worker mapping the same files shares one physical copy. Later edits
+    go to the index's small private delta, so the mapping stays shared.
+    """
+    from .index import FreelancerIndex
+
+    with open(os.path.join(path, "manifest.json"), encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    if manifest["format"] != ARTIFACT_FORMAT:
+        raise ValueError(f"Unsupported match artifact format {manifest['format']}")
+
+    arrays = {
+        name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r", allow_pickle=False)
+        for name in ARRAYS
+    }
+    vectorizer = build_vectorizer()
+    vectorizer.vocabulary_ = {str(term): col for col, term in enumerate(arrays["terms"])}
+    vectorizer.idf_ = np.asarray(arrays["idf"])
+    matrix = sparse.csr_matrix(
+        (arrays["data"], arrays["indices"], arrays["indptr"]), shape=tuple(manifest["shape"])
+    )
+    with open(os.path.join(path, "skills.json"), encoding="utf-8") as handle:
+        skills = json.load(handle)
+
+    index = FreelancerIndex(vectorizer, matrix, arrays["freelancer_ids"].tolist(), skills)
+    if manifest["synced_at"]:
+        index.synced_at = datetime.fromisoformat(manifest["synced_at"])
+    return index
+
+
+def current_artifact_path(root):
+    path = os.path.join(root, "current")
+    return os.path.realpath(path) if os.path.exists(path) else None
+
+
+def publish_index_artifact(index, root, keep=2):
+    """Save ``index`` as a new release under ``root`` and atomically repoint ``current``."""
+    releases = os.path.join(root, "releases")
+    os.makedirs(releases, exist_ok=True)
+    release = os.path.join(releases, time.strftime("%Y%m%d%H%M%S") + f"-{os.getpid()}")
+    save_index_artifact(index, release)
+
+    link = os.path.join(root, "current")
+    tmp_link = f"{link}.{os.getpid()}.tmp"
+    os.symlink(os.path.relpath(release, root), tmp_link)
+    # rename() over the old link is atomic, so readers see the old or the new release.
+    os.replace(tmp_link, link)
+
+    # Older releases may still be mapped by running workers; unlinking is safe for them.
+    for name in sorted(os.listdir(releases))[:-keep]:
+        path = os.path.join(releases, name)
+        if path != release:
+            shutil.rmtree(path, ignore_errors=True)
+    return release
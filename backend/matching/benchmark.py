@@ -0,0 +1,187 @@
+import random
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+
+from accounts.models import (
+    ClientProfile,
+    FreelancerProfile,
+    FreelancerSkill,
+    Resume,
+    ResumeCertification,
+    ResumeEducation,
+    ResumeExperience,
+    ResumeLink,
+    Skill,
+)
+from projects.models import Project, ProjectSkill
+from .skills import normalize_skills
+
+BENCH_DOMAIN = "bench.skillsync"
+
+SKILL_GROUPS = {
+    "Web Development": ["react", "node.js", "javascript", "typescript", "vue", "css", "html", "graphql"],
+    "Backend": ["python", "django", "flask", "postgresql", "redis", "go", "java", "api"],
+    "AI/ML": ["nlp", "tensorflow", "pytorch", "machine learning", "pandas", "numpy", "computer vision"],
+    "Mobile": ["swift", "kotlin", "flutter", "react native", "android", "ios"],
+    "Design": ["figma", "ux", "ui", "product design", "research", "illustrator"],
+    "DevOps": ["docker", "kubernetes", "aws", "terraform", "ci/cd", "linux"],
+}
+WORDS = (
+    "build deliver scalable secure platform dashboard integration analytics pipeline "
+    "customer support payments marketplace realtime reporting automation migration "
+    "performance testing mobile cloud data model search onboarding workflow billing"
+).split()
+COMPANIES = ["Acme", "Nova Labs", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne"]
+SCHOOLS = ["Global Tech University", "State College", "Institute of Design", "Open University"]
+
+
+def _sentence(rng, length):
+    return " ".join(rng.choice(WORDS) for _ in range(length)).capitalize() + "."
+
+
+def generate_dataset(freelancers, projects, seed=0, batch_size=2000):
+    """Create deterministic freelancers with full resumes, clients and projects.
+
+    Uses bulk_create throughout, so model signals do not fire; match documents
+    are built lazily by the index like any other backfill. Skill links are
+    written here because bulk_create skips the model save() that syncs them.
+    """
+    rng = random.Random(seed)
+    User = get_user_model()
+    categories = list(SKILL_GROUPS)
+    levels = [choice for choice, _ in FreelancerProfile.ExperienceLevel.choices]
+
+    freelancer_users = User.objects.bulk_create(
+        [
+            User(
+                username=f"bench-freelancer-{i}",
+                email=f"freelancer{i}@{BENCH_DOMAIN}",
+                role=User.Role.FREELANCER,
+                password="!",
+            )
+            for i in range(freelancers)
+        ],
+        batch_size=batch_size,
+    )
+    profiles = []
+    for i, user in enumerate(freelancer_users):
+        group = SKILL_GROUPS[categories[i % len(categories)]]
+        extra = SKILL_GROUPS[rng.choice(categories)]
+        skills = sorted(set(rng.sample(group, 3) + rng.sample(extra, 2)))
+        profiles.append(
+            FreelancerProfile(
+                user=user,
+                name=f"Bench Freelancer {i}",
+                skills=skills,
+                normalized_skills=normalize_skills(skills),
+                experience_level=rng.choice(levels),
+                hourly_rate=Decimal(rng.randint(15, 150)),
+                bio=_sentence(rng, 12),
+                rating=round(rng.uniform(2.5, 5.0), 1),
+            )
+        )
+    profiles = FreelancerProfile.objects.bulk_create(profiles, batch_size=batch_size)
+
+    resumes = Resume.objects.bulk_create(
+        [
+            Resume(
+                freelancer=profile,
+                headline=f"{profile.experience_level} {' '.join(profile.skills[:2])} specialist",
+                summary=_sentence(rng, 25),
+                location="Remote",
+                website=f"https://{profile.user.username}.{BENCH_DOMAIN}",
+            )
+            for profile in profiles
+        ],
+        batch_size=batch_size,
+    )
+    experiences, education, certifications, links = [], [], [], []
+    for resume in resumes:
+        for _ in range(rng.randint(1, 3)):
+            experiences.append(
+                ResumeExperience(
+                    resume=resume,
+                    title=rng.choice(["Engineer", "Developer", "Consultant", "Designer", "Lead"]),
+                    company=rng.choice(COMPANIES),
+                    location="Remote",
+                    description=_sentence(rng, 30),
+                )
+            )
+        education.append(
+            ResumeEducation(
+                resume=resume,
+                school=rng.choice(SCHOOLS),
+                degree="BSc",
+                field_of_study=rng.choice(["Computer Science", "Design", "Mathematics"]),
+                end_year=rng.randint(2005, 2024),
+            )
+        )
+        certifications.append(
+            ResumeCertification(resume=resume, name=f"{rng.choice(WORDS).title()} Certificate")
+        )
+        links.append(ResumeLink(resume=resume, platform="Portfolio", url=resume.website))
+    ResumeExperience.objects.bulk_create(experiences, batch_size=batch_size)
+    ResumeEducation.objects.bulk_create(education, batch_size=batch_size)
+    ResumeCertification.objects.bulk_create(certifications, batch_size=batch_size)
+    ResumeLink.objects.bulk_create(links, batch_size=batch_size)
+
+    client_count = max(1, projects // 10)
+    client_users = User.objects.bulk_create(
+        [
+            User(
+                username=f"bench-client-{i}",
+                email=f"client{i}@{BENCH_DOMAIN}",
+                role=User.Role.CLIENT,
+                password="!",
+            )
+            for i in range(client_count)
+        ],
+        batch_size=batch_size,
+    )
+    clients = ClientProfile.objects.bulk_create(
+        [
+            ClientProfile(user=user, name=f"Bench Client {i}", company_name=rng.choice(COMPANIES))
+            for i, user in enumerate(client_users)
+        ],
+        batch_size=batch_size,
+    )
+
+    project_rows = []
+    for i in range(projects):
+        category = categories[i % len(categories)]
+        budget_min = rng.randint(5, 80) * 100
+        required_skills = sorted(rng.sample(SKILL_GROUPS[category], 4))
+        project_rows.append(
+            Project(
+                client=clients[i % client_count],
+                title=f"{category} project {i}",
+                description=_sentence(rng, 40),
+                required_skills=required_skills,
+                normalized_skills=normalize_skills(required_skills),
+                budget_min=Decimal(budget_min),
+                budget_max=Decimal(budget_min + rng.randint(5, 50) * 100),
+                category=category,
+            )
+        )
+    project_rows = Project.objects.bulk_create(project_rows, batch_size=batch_size)
+
+    skill_ids = Skill.objects.ids_for(
+        {name for row in [*profiles, *project_rows] for name in row.normalized_skills}
+    )
+    FreelancerSkill.objects.bulk_create(
+        [
+            FreelancerSkill(freelancer=profile, skill_id=skill_ids[name])
+            for profile in profiles
+            for name in profile.normalized_skills
+        ],
+        batch_size=batch_size,
+    )
+    ProjectSkill.objects.bulk_create(
+        [
+            ProjectSkill(project=project, skill_id=skill_ids[name])
+            for project in project_rows
+            for name in project.normalized_skills
+        ],
+        batch_size=batch_size,
+    )
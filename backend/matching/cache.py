@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from skillsync.cache import bump_cache_version, cache_version
+
+CORPUS_VERSION_KEY = "matching:corpus-version"
+
+
+def corpus_version():
+    return cache_version(CORPUS_VERSION_KEY)
+
+
+def bump_corpus_version():
+    bump_cache_version(CORPUS_VERSION_KEY)
+
+
+def match_cache_key(kind, target_id, weights, top_n):
+    weights_key = "default"
+    if weights:
+        weights_key = ",".join(f"{weights[name]:.6f}" for name in ("skill", "experience", "rating"))
+    return f"matching:{kind}:{target_id}:{corpus_version()}:{weights_key}:{top_n}"
+
+
+def cached_matches(kind, target_id, weights, top_n, compute, timer=None):
+    """Return ``compute()`` for these inputs, reusing a result from the same corpus version."""
+    timeout = settings.MATCHING_RESULT_CACHE_TTL
+    if not timeout:
+        return compute()
+
+    # The key pins the version read before computing, so a concurrent change
+    # leaves this result under a version nobody asks for again.
+    key = match_cache_key(kind, target_id, weights, top_n)
+    matches = cache.get(key)
+    if timer is not None:
+        timer.count("cache_hits", int(matches is not None))
+    if matches is None:
+        matches = compute()
+        cache.set(key, matches, timeout)
+    return matches
@@ -0,0 +1,61 @@
+from django.db.models import F, Q
+
+from accounts.models import FreelancerProfile
+from .engine import MatchingEngine
+from .models import FreelancerDocument
+
+
+def _resume_queryset():
+    return FreelancerProfile.objects.select_related("resume").prefetch_related(
+        "resume__experiences",
+        "resume__education",
+        "resume__certifications",
+        "resume__links",
+    )
+
+
+def _resume_updated_at(freelancer):
+    try:
+        return freelancer.resume.updated_at
+    except FreelancerProfile.resume.RelatedObjectDoesNotExist:
+        return None
+
+
+def refresh_freelancer_documents(freelancer_ids):
+    engine = MatchingEngine()
+    documents = [
+        FreelancerDocument(
+            freelancer=freelancer,
+            text=engine._build_freelancer_text(freelancer),
+            skills=freelancer.normalized_skills,
+            resume_updated_at=_resume_updated_at(freelancer),
+        )
+        for freelancer in _resume_queryset().filter(id__in=list(freelancer_ids))
+    ]
+    FreelancerDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["freelancer"],
+        update_fields=["text", "skills", "resume_updated_at", "updated_at"],
+    )
+    return documents
+
+
+def stale_freelancer_ids():
+    # Catches writes that bypassed the signals, e.g. QuerySet.update() on resumes.
+    return FreelancerProfile.objects.filter(
+        Q(match_document__isnull=True)
+        | Q(resume__updated_at__gt=F("match_document__resume_updated_at"))
+        | Q(resume__isnull=False, match_document__resume_updated_at__isnull=True)
+    ).values_list("id", flat=True)
+
+
+def ensure_freelancer_documents():
+    return refresh_freelancer_documents(list(stale_freelancer_ids()))
+
+
+def rebuild_freelancer_documents(chunk_size=500):
+    ids = list(FreelancerProfile.objects.order_by("id").values_list("id", flat=True))
+    for start in range(0, len(ids), chunk_size):
+        refresh_freelancer_documents(ids[start : start + chunk_size])
+    return len(ids)
@@ -1,49 +1,70 @@
+import heapq
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from contextlib import nullcontext
 
-SKILL_MAP = {
-    "reactjs": "react",
-    "react.js": "react",
-    "nodejs": "node.js",
-    "node": "node.js",
-    "typescript": "typescript",
-    "js": "javascript",
-    "py": "python",
-}
+from .lazy import np, sklearn_text
+from .skills import SKILL_MAP, normalize_skill, normalize_skills  # noqa: F401
 
+def preprocess_text(text: str) -> str:
+    return re.sub(r"\s+", " ", text.lower()).strip()
 
-def normalize_skill(skill: str) -> str:
-    cleaned = re.sub(r"[^a-z0-9.+#]", "", skill.lower().strip())
-    return SKILL_MAP.get(cleaned, cleaned)
 
+EXPERIENCE_SCORES = {"Junior": 0.5, "Mid": 0.75, "Senior": 1.0}
 
-def normalize_skills(skills):
-    if not skills:
-        return []
-    normalized = [normalize_skill(s) for s in skills if s]
-    return sorted(set(normalized))
 
+def top_n_indices(scores, top_n):
+    if top_n < len(scores):
+        candidates = np.argpartition(-scores, top_n - 1)[:top_n]
+    else:
+        candidates = np.arange(len(scores))
+    # lexsort keeps equal scores in input order, like the stable sort it replaces.
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+class NullTimer:
+    def stage(self, name):
+        return nullcontext()
+
+    def count(self, name, value):
+        pass
 
-def preprocess_text(text: str) -> str:
-    return re.sub(r"\s+", " ", text.lower()).strip()
+
+def build_vectorizer():
+    return sklearn_text.TfidfVectorizer(stop_words="english", lowercase=True, max_features=1500)
 
 
 class MatchingEngine:
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(stop_words="english", lowercase=True, max_features=1500)
+    def __init__(self, index=None, timer=None, executor=None, project_index=None):
+        self.index = index
+        self._project_vectors = {}
+        self.project_index = project_index
+        self.timer = timer or NullTimer()
+        # Optional ShardedScorer; large pools are then scored across processes.
+        self.executor = executor
 
     def _experience_score(self, level: str) -> float:
-        levels = {"Junior": 0.5, "Mid": 0.75, "Senior": 1.0}
-        return levels.get(level, 0.5)
+        return EXPERIENCE_SCORES.get(level, 0.5)
 
     def _rating_score(self, rating: float) -> float:
         if rating is None:
             return 0.0
         return max(min(rating / 5.0, 1.0), 0.0)
 
+    def _experience_scores(self, freelancers):
+        return np.fromiter(
+            (EXPERIENCE_SCORES.get(f.experience_level, 0.5) for f in freelancers),
+            dtype=np.float64,
+            count=len(freelancers),
+        )
+
+    def _rating_scores(self, freelancers):
+        ratings = np.fromiter(
+            (f.rating or 0.0 for f in freelancers), dtype=np.float64, count=len(freelancers)
+        )
+        return np.clip(ratings / 5.0, 0.0, 1.0)
+
     def _build_project_text(self, project) -> str:
-        skills = " ".join(normalize_skills(project.required_skills))
+        skills = " ".join(project.normalized_skills)
         parts = [project.title, project.description, skills, project.category]
         return preprocess_text(" ".join([p for p in parts if p]))
 
@@ -78,88 +99,236 @@ class MatchingEngine:
         return " ".join([p for p in parts if p])
 
     def _build_freelancer_text(self, freelancer) -> str:
-        skills = " ".join(normalize_skills(freelancer.skills))
+        skills = " ".join(freelancer.normalized_skills)
         resume_text = self._build_resume_text(freelancer)
         parts = [skills, freelancer.bio or "", freelancer.experience_level, resume_text]
         return preprocess_text(" ".join([p for p in parts if p]))
 
-    def _build_project_corpus(self, project, freelancers):
-        project_text = self._build_project_text(project)
-        freelancer_texts = [self._build_freelancer_text(f) for f in freelancers]
-        return project_text, freelancer_texts
-
-    def match_project_to_freelancers(self, project, freelancers, weights=None, top_n=20):
+    def _project_vector(self, project):
+        # Cached per engine, so an ANN lookup and the ranking share one transform.
+        if project.id not in self._project_vectors:
+            with self.timer.stage("text_build"):
+                project_text = self._build_project_text(project)
+            with self.timer.stage("vectorize"):
+                self._project_vectors[project.id] = self.index.transform([project_text])
+        return self._project_vectors[project.id]
+
+    def ann_candidate_ids(self, project):
+        """Freelancer IDs sharing an LSH bucket with ``project``; one lookup per call."""
+        project_vector = self._project_vector(project)
+        with self.timer.stage("ann_lookup"):
+            candidates = self.index.ann_candidates(project_vector)
+        self.timer.count("ann_candidates", len(candidates))
+        return candidates
+
+    def _chunk_similarities(self, project_vector, freelancer_ids):
+        with self.timer.stage("similarity"):
+            # Index rows are L2-normalised, so the dot product is the cosine similarity.
+            freelancer_matrix = self.index.vectors_for(freelancer_ids)
+            return (freelancer_matrix @ project_vector.T).toarray().ravel()
+
+    def _indexed_similarities(self, project, freelancers):
+        project_vector = self._project_vector(project)
+        return self._chunk_similarities(project_vector, [f.id for f in freelancers])
+
+    def match_project_to_freelancers(
+        self, project, freelancers, weights=None, top_n=20, search="exact"
+    ):
+        if self.index is None:
+            raise ValueError("Project matches need a fitted FreelancerIndex")
+        freelancers = list(freelancers)
+        if search == "ann":
+            # Only freelancers in the project's LSH buckets are ranked at all.
+            candidates = self.ann_candidate_ids(project)
+            freelancers = [f for f in freelancers if f.id in candidates]
         if not freelancers:
             return []
 
         weights = weights or {"skill": 0.6, "experience": 0.3, "rating": 0.1}
-        project_text, freelancer_texts = self._build_project_corpus(project, freelancers)
-        corpus = [project_text] + freelancer_texts
-
-        tfidf_matrix = self.vectorizer.fit_transform(corpus)
-        similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:]).flatten()
-
-        results = []
-        project_skills = normalize_skills(project.required_skills)
-
-        for idx, freelancer in enumerate(freelancers):
-            skill_score = float(similarities[idx])
-            exp_score = self._experience_score(freelancer.experience_level)
-            rating_score = self._rating_score(freelancer.rating)
-            final_score = (
-                weights["skill"] * skill_score
-                + weights["experience"] * exp_score
-                + weights["rating"] * rating_score
+        if (
+            self.executor is not None
+            and self.executor.is_parallel(len(freelancers))
+        ):
+            return self.match_projects_to_freelancers([project], freelancers, weights, top_n)[
+                project.id
+            ]
+        self.timer.count("candidates", len(freelancers))
+        similarities = self._indexed_similarities(project, freelancers)
+
+        with self.timer.stage("scoring"):
+            return self._rank_freelancers(
+                project,
+                freelancers,
+                similarities,
+                self._experience_scores(freelancers),
+                self._rating_scores(freelancers),
+                weights,
+                top_n,
             )
-            matched_skills = [s for s in normalize_skills(freelancer.skills) if s in project_skills]
-
-            results.append(
-                {
-                    "freelancer_id": freelancer.id,
-                    "score": round(final_score * 100, 2),
-                    "skill_match": round(skill_score * 100, 2),
-                    "matched_skills": matched_skills,
-                }
+
+    def _rank_freelancers(
+        self, project, freelancers, similarities, exp_scores, rating_scores, weights, top_n
+    ):
+        scores = (
+            weights["skill"] * similarities
+            + weights["experience"] * exp_scores
+            + weights["rating"] * rating_scores
+        )
+
+        project_skills = set(project.normalized_skills)
+        return [
+            self._freelancer_result(
+                project_skills, freelancers[idx], scores[idx], similarities[idx]
             )
+            for idx in top_n_indices(scores, top_n)
+        ]
 
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:top_n]
+    def _freelancer_result(self, project_skills, freelancer, score, similarity):
+        return {
+            "freelancer_id": freelancer.id,
+            "score": round(float(score) * 100, 2),
+            "skill_match": round(float(similarity) * 100, 2),
+            "matched_skills": [s for s in freelancer.normalized_skills if s in project_skills],
+        }
+
+    def match_project_to_freelancer_chunks(
+        self, project, chunks, weights=None, top_n=20, search="exact"
+    ):
+        """Stream ``chunks`` of freelancers, keeping only a running top-N heap.
+
+        Peak memory is one chunk plus ``top_n`` winners, whatever the pool size.
+        Requires a fitted index, since the vocabulary cannot be fitted chunk by chunk.
+        Callers should restrict ``chunks`` to ``ann_candidate_ids()`` up front; with
+        ``search="ann"`` the chunks are only filtered here.
+        """
+        if self.index is None:
+            raise ValueError("Streaming matches need a fitted FreelancerIndex")
 
-    def match_freelancer_to_projects(self, freelancer, projects, weights=None, top_n=20):
-        if not projects:
-            return []
+        weights = weights or {"skill": 0.6, "experience": 0.3, "rating": 0.1}
+        project_vector = self._project_vector(project)
+        candidates = self.ann_candidate_ids(project) if search == "ann" else None
+        heap = []
+        seen = 0
+        for chunk in chunks:
+            if candidates is not None:
+                chunk = [f for f in chunk if f.id in candidates]
+            if not chunk:
+                continue
+            similarities = self._chunk_similarities(project_vector, [f.id for f in chunk])
+            with self.timer.stage("scoring"):
+                scores = (
+                    weights["skill"] * similarities
+                    + weights["experience"] * self._experience_scores(chunk)
+                    + weights["rating"] * self._rating_scores(chunk)
+                )
+                for idx in top_n_indices(scores, top_n):
+                    # Negated position breaks ties toward earlier freelancers, as in the full sort.
+                    entry = (float(scores[idx]), -(seen + idx), float(similarities[idx]), chunk[idx])
+                    if len(heap) < top_n:
+                        heapq.heappush(heap, entry)
+                    elif entry[:2] > heap[0][:2]:
+                        heapq.heapreplace(heap, entry)
+            seen += len(chunk)
+
+        self.timer.count("candidates", seen)
+        project_skills = set(project.normalized_skills)
+        return [
+            self._freelancer_result(project_skills, freelancer, score, similarity)
+            for score, _, similarity, freelancer in sorted(heap, key=lambda e: e[:2], reverse=True)
+        ]
+
+    def match_projects_to_freelancers(self, projects, freelancers, weights=None, top_n=20):
+        if self.index is None:
+            raise ValueError("Project matches need a fitted FreelancerIndex")
+        projects = list(projects)
+        freelancers = list(freelancers)
+        if not projects or not freelancers:
+            return {project.id: [] for project in projects}
 
         weights = weights or {"skill": 0.6, "experience": 0.3, "rating": 0.1}
-        freelancer_text = self._build_freelancer_text(freelancer)
-        project_texts = [self._build_project_text(p) for p in projects]
-        corpus = [freelancer_text] + project_texts
-
-        tfidf_matrix = self.vectorizer.fit_transform(corpus)
-        similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:]).flatten()
-
-        freelancer_skills = normalize_skills(freelancer.skills)
-        results = []
-
-        for idx, project in enumerate(projects):
-            skill_score = float(similarities[idx])
-            exp_score = self._experience_score(freelancer.experience_level)
-            rating_score = self._rating_score(freelancer.rating)
-            final_score = (
-                weights["skill"] * skill_score
-                + weights["experience"] * exp_score
-                + weights["rating"] * rating_score
-            )
-            project_skills = normalize_skills(project.required_skills)
-            matched_skills = [s for s in freelancer_skills if s in project_skills]
-
-            results.append(
-                {
-                    "project_id": project.id,
-                    "score": round(final_score * 100, 2),
-                    "skill_match": round(skill_score * 100, 2),
-                    "matched_skills": matched_skills,
+        self.timer.count("candidates", len(freelancers))
+        with self.timer.stage("text_build"):
+            project_texts = [self._build_project_text(p) for p in projects]
+        with self.timer.stage("vectorize"):
+            freelancer_matrix = self.index.vectors_for([f.id for f in freelancers])
+            project_matrix = self.index.transform(project_texts)
+
+        if self.executor is not None and self.executor.is_parallel(len(freelancers)):
+            with self.timer.stage("scoring"):
+                ranked = self.executor.rank(
+                    project_matrix,
+                    freelancer_matrix,
+                    self._experience_scores(freelancers),
+                    self._rating_scores(freelancers),
+                    weights,
+                    top_n,
+                )
+                return {
+                    project.id: [
+                        self._freelancer_result(
+                            set(project.normalized_skills), freelancers[pos], score, similarity
+                        )
+                        for pos, score, similarity in zip(*ranked[row])
+                    ]
+                    for row, project in enumerate(projects)
                 }
-            )
 
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:top_n]
+        with self.timer.stage("similarity"):
+            # One sparse product scores every project; rows are L2-normalised so it is cosine.
+            similarity_matrix = (project_matrix @ freelancer_matrix.T).tocsr()
+
+        with self.timer.stage("scoring"):
+            exp_scores = self._experience_scores(freelancers)
+            rating_scores = self._rating_scores(freelancers)
+            return {
+                project.id: self._rank_freelancers(
+                    project,
+                    freelancers,
+                    similarity_matrix[row].toarray().ravel(),
+                    exp_scores,
+                    rating_scores,
+                    weights,
+                    top_n,
+                )
+                for row, project in enumerate(projects)
+            }
+
+    def match_freelancer_to_indexed_projects(self, freelancer, freelancer_text, weights=None, top_n=20):
+        """Rank every open project in ``project_index`` for ``freelancer``.
+
+        ``freelancer_text`` is the freelancer's stored match document text.
+        """
+        if self.project_index is None:
+            raise ValueError("Indexed project matches need a ProjectIndex")
+
+        project_index = self.project_index
+        # One snapshot, so a concurrent upsert cannot pair these IDs with another matrix.
+        rows = project_index.rows
+        weights = weights or {"skill": 0.6, "experience": 0.3, "rating": 0.1}
+        self.timer.count("candidates", len(rows))
+        if not len(rows):
+            return []
+
+        with self.timer.stage("vectorize"):
+            freelancer_vector = project_index.transform([freelancer_text])
+        with self.timer.stage("similarity"):
+            similarities = (rows.matrix @ freelancer_vector.T).toarray().ravel()
+
+        with self.timer.stage("scoring"):
+            scores = weights["skill"] * similarities + (
+                weights["experience"] * self._experience_score(freelancer.experience_level)
+                + weights["rating"] * self._rating_score(freelancer.rating)
+            )
+            freelancer_skills = freelancer.normalized_skills
+            results = []
+            for idx in top_n_indices(scores, top_n):
+                project_skills = set(rows.skills[idx])
+                results.append(
+                    {
+                        "project_id": rows.project_ids[idx],
+                        "score": round(float(scores[idx]) * 100, 2),
+                        "skill_match": round(float(similarities[idx]) * 100, 2),
+                        "matched_skills": [s for s in freelancer_skills if s in project_skills],
+                    }
+                )
+            return results
@@ -0,0 +1,507 @@
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+from projects.models import Project
+from .ann import RandomProjectionLSH
+from .artifacts import current_artifact_path, load_index_artifact
+from .documents import ensure_freelancer_documents, refresh_freelancer_documents
+from .engine import MatchingEngine, build_vectorizer
+from .lazy import np, sparse
+from .models import FreelancerDocument
+
+
+class FreelancerRows:
+    """One immutable version of the freelancer matrix and its row IDs.
+
+    The base matrix (possibly memory-mapped from an artifact) is never written.
+    Edited and new freelancers live in a small private ``delta`` matrix, and
+    their stale or deleted base rows are hidden by ``tombstones``; both fold
+    into the base at the next refit or published artifact.
+
+    Writers build a new instance and swap it in with a single assignment, so a
+    reader that takes ``index.rows`` once always pairs IDs with the right rows.
+    """
+
+    def __init__(self, base, base_ids, delta=None, delta_ids=(), tombstones=frozenset(), base_positions=None):
+        self.base = base
+        self.base_ids = base_ids
+        self.base_positions = base_positions
+        if base_positions is None:
+            self.base_positions = {fid: pos for pos, fid in enumerate(base_ids)}
+        self.delta = delta if delta is not None else sparse.csr_matrix((0, base.shape[1]))
+        self.delta_ids = list(delta_ids)
+        self.delta_positions = {fid: pos for pos, fid in enumerate(self.delta_ids)}
+        # Base IDs whose row is deleted or superseded by a delta row.
+        self.tombstones = frozenset(tombstones)
+
+    def __len__(self):
+        return len(self.base_ids) - len(self.tombstones) + len(self.delta_ids)
+
+    def __contains__(self, freelancer_id):
+        return self.position(freelancer_id) is not None
+
+    def position(self, freelancer_id):
+        pos = self.delta_positions.get(freelancer_id)
+        if pos is not None:
+            return len(self.base_ids) + pos
+        if freelancer_id in self.tombstones:
+            return None
+        return self.base_positions.get(freelancer_id)
+
+    @property
+    def freelancer_ids(self):
+        if not self.tombstones:
+            return list(self.base_ids) + self.delta_ids
+        return [fid for fid in self.base_ids if fid not in self.tombstones] + self.delta_ids
+
+    @property
+    def matrix(self):
+        """Base plus delta as one matrix, in ``freelancer_ids`` order.
+
+        Copies the base whenever there are edits, so it is only for artifact
+        publishing and diagnostics, never the request path.
+        """
+        if not self.tombstones and not self.delta_ids:
+            return self.base
+        alive = [pos for pos, fid in enumerate(self.base_ids) if fid not in self.tombstones]
+        return sparse.vstack([self.base[alive], self.delta], format="csr")
+
+    def vectors(self, freelancer_ids):
+        positions = np.fromiter(
+            (self.position(fid) for fid in freelancer_ids),
+            dtype=np.int64,
+            count=len(freelancer_ids),
+        )
+        in_base = positions < len(self.base_ids)
+        if in_base.all():
+            return self.base[positions]
+        # Gather base and delta rows separately, then restore the requested order.
+        stacked = sparse.vstack(
+            [self.base[positions[in_base]], self.delta[positions[~in_base] - len(self.base_ids)]],
+            format="csr",
+        )
+        order = np.empty(len(positions), dtype=np.int64)
+        base_count = int(in_base.sum())
+        order[in_base] = np.arange(base_count)
+        order[~in_base] = base_count + np.arange(len(positions) - base_count)
+        return stacked[order]
+
+    def upserted(self, freelancer_ids, vectors):
+        replaced = set(freelancer_ids)
+        keep = [pos for pos, fid in enumerate(self.delta_ids) if fid not in replaced]
+        return FreelancerRows(
+            self.base,
+            self.base_ids,
+            sparse.vstack([self.delta[keep], vectors], format="csr"),
+            [self.delta_ids[pos] for pos in keep] + list(freelancer_ids),
+            self.tombstones | (replaced & self.base_positions.keys()),
+            self.base_positions,
+        )
+
+    def removed(self, freelancer_ids):
+        removed = set(freelancer_ids)
+        keep = [pos for pos, fid in enumerate(self.delta_ids) if fid not in removed]
+        return FreelancerRows(
+            self.base,
+            self.base_ids,
+            self.delta[keep],
+            [self.delta_ids[pos] for pos in keep],
+            self.tombstones | (removed & self.base_positions.keys()),
+            self.base_positions,
+        )
+
+
+class FreelancerIndex:
+    """Fitted TF-IDF vocabulary plus the freelancer document matrix.
+
+    The vocabulary and IDF weights are fixed at build time; syncing only
+    transforms the FreelancerDocument rows that changed since the last sync.
+    """
+
+    def __init__(self, vectorizer, matrix, freelancer_ids, skills=None):
+        self.vectorizer = vectorizer
+        self.rows = FreelancerRows(sparse.csr_matrix(matrix), list(freelancer_ids))
+        self._skills = {}
+        self._postings = defaultdict(set)
+        for fid, freelancer_skills in zip(self.rows.base_ids, skills or []):
+            self._add_postings(fid, freelancer_skills)
+        self._lock = threading.Lock()
+        # Document updated_at last applied per freelancer, so overlapping syncs skip repeats.
+        self._applied = {}
+        self.ann = None
+        self.built_at = time.monotonic()
+        self.synced_at = None
+
+    @classmethod
+    def build(cls, documents):
+        ids = [fid for fid, _, _ in documents]
+        texts = [text for _, text, _ in documents]
+        vectorizer = build_vectorizer()
+        if any(texts):
+            matrix = vectorizer.fit_transform(texts)
+        else:
+            # An empty pool still needs a usable vocabulary for transform().
+            vectorizer.fit(["empty"])
+            matrix = sparse.csr_matrix((len(ids), len(vectorizer.vocabulary_)))
+        return cls(vectorizer, matrix, ids, [skills for _, _, skills in documents])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, freelancer_id):
+        return freelancer_id in self.rows
+
+    def transform(self, texts):
+        return self.vectorizer.transform(texts)
+
+    def _add_postings(self, freelancer_id, skills):
+        self._skills[freelancer_id] = tuple(skills)
+        for skill in skills:
+            self._postings[skill].add(freelancer_id)
+
+    def _drop_postings(self, freelancer_id):
+        for skill in self._skills.pop(freelancer_id, ()):
+            postings = self._postings.get(skill)
+            if postings is not None:
+                postings.discard(freelancer_id)
+                if not postings:
+                    del self._postings[skill]
+
+    def enable_ann(self, n_tables=None, n_bits=None, seed=0):
+        with self._lock:
+            rows = self.rows
+            ann = RandomProjectionLSH(
+                rows.matrix.shape[1],
+                n_tables=n_tables or settings.MATCHING_ANN_TABLES,
+                n_bits=n_bits or settings.MATCHING_ANN_BITS,
+                seed=seed,
+            )
+            ann.add(rows.freelancer_ids, rows.matrix)
+            self.ann = ann
+        return ann
+
+    def ann_candidates(self, vector, probe_radius=None):
+        if self.ann is None:
+            self.enable_ann()
+        if probe_radius is None:
+            probe_radius = settings.MATCHING_ANN_PROBE_RADIUS
+        return self.ann.query(vector, probe_radius)
+
+    def candidate_ids(self, skills, min_candidates=None, max_candidates=None):
+        """Freelancer IDs sharing at least one of ``skills``, most overlap first.
+
+        Returns ``None`` when fewer than ``min_candidates`` share a skill and the
+        fallback setting says to score the whole pool instead.
+        """
+        if min_candidates is None:
+            min_candidates = settings.MATCHING_CANDIDATE_MIN
+        if max_candidates is None:
+            max_candidates = settings.MATCHING_CANDIDATE_MAX
+
+        overlap = Counter()
+        # Postings are edited in place by upsert(), so read them under the same lock.
+        with self._lock:
+            for skill in set(skills):
+                overlap.update(self._postings.get(skill, ()))
+
+        if len(overlap) < min_candidates and settings.MATCHING_CANDIDATE_FALLBACK == "all":
+            return None
+        if max_candidates and len(overlap) > max_candidates:
+            return [fid for fid, _ in overlap.most_common(max_candidates)]
+        return list(overlap)
+
+    def upsert(self, documents):
+        if not documents:
+            return
+        ids = [fid for fid, _, _ in documents]
+        vectors = self.transform([text for _, text, _ in documents])
+        with self._lock:
+            for fid, _, skills in documents:
+                self._drop_postings(fid)
+                self._add_postings(fid, skills)
+            if self.ann is not None:
+                self.ann.add(ids, vectors)
+            self.rows = self.rows.upserted(ids, vectors)
+
+    def apply_changes(self, changes):
+        """Upsert ``(freelancer_id, text, skills, updated_at)`` rows not already applied."""
+        fresh = [change for change in changes if self._applied.get(change[0]) != change[3]]
+        self.upsert([change[:3] for change in fresh])
+        with self._lock:
+            self._applied.update((change[0], change[3]) for change in fresh)
+
+    def remove(self, freelancer_ids):
+        with self._lock:
+            rows = self.rows
+            removed = {fid for fid in freelancer_ids if fid in rows}
+            if not removed:
+                return
+            for fid in removed:
+                self._drop_postings(fid)
+            if self.ann is not None:
+                self.ann.remove(removed)
+            self.rows = rows.removed(removed)
+
+    def vectors_for(self, freelancer_ids):
+        rows = self.rows
+        missing = [fid for fid in freelancer_ids if fid not in rows]
+        if missing:
+            self.upsert(load_documents(missing))
+            rows = self.rows
+        return rows.vectors(freelancer_ids)
+
+
+def load_documents(freelancer_ids=None):
+    documents = FreelancerDocument.objects.order_by("freelancer_id")
+    if freelancer_ids is not None:
+        ids = list(freelancer_ids)
+        refresh_freelancer_documents(
+            set(ids) - set(documents.filter(freelancer_id__in=ids).values_list("freelancer_id", flat=True))
+        )
+        documents = documents.filter(freelancer_id__in=ids)
+    else:
+        ensure_freelancer_documents()
+    return list(documents.values_list("freelancer_id", "text", "skills"))
+
+
+def build_freelancer_index():
+    artifact = None
+    if settings.MATCHING_ARTIFACT_DIR:
+        artifact = current_artifact_path(settings.MATCHING_ARTIFACT_DIR)
+    if artifact:
+        # Mapping a prebuilt artifact takes milliseconds; sync covers edits made since it was built.
+        return sync_freelancer_index(load_index_artifact(artifact))
+    return fit_freelancer_index()
+
+
+def fit_freelancer_index():
+    synced_at = timezone.now()
+    index = FreelancerIndex.build(load_documents())
+    index.synced_at = synced_at
+    return index
+
+
+def sync_watermark(index):
+    # updated_at is stamped before commit, so a slow transaction can land behind the
+    # previous watermark; re-reading an overlap window picks it up.
+    return index.synced_at - timedelta(seconds=settings.MATCHING_SYNC_OVERLAP)
+
+
+def sync_freelancer_index(index):
+    synced_at = timezone.now()
+    changed = FreelancerDocument.objects.filter(updated_at__gte=sync_watermark(index))
+    index.apply_changes(list(changed.values_list("freelancer_id", "text", "skills", "updated_at")))
+    if FreelancerDocument.objects.count() != len(index):
+        current = set(FreelancerDocument.objects.values_list("freelancer_id", flat=True))
+        index.remove(set(index.rows.freelancer_ids) - current)
+    index.synced_at = synced_at
+    return index
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def _is_expired(index):
+    max_age = settings.MATCHING_INDEX_MAX_AGE
+    return bool(max_age) and time.monotonic() - index.built_at > max_age
+
+
+def get_freelancer_index():
+    global _index
+    if _index is None or _is_expired(_index):
+        with _index_lock:
+            if _index is None or _is_expired(_index):
+                _index = build_freelancer_index()
+                return _index
+    return sync_freelancer_index(_index)
+
+
+def warm_freelancer_index():
+    """Map the published artifact now, so the worker's first match request does not."""
+    if not settings.MATCHING_ARTIFACT_DIR or not current_artifact_path(settings.MATCHING_ARTIFACT_DIR):
+        # Without an artifact the index would be fitted here, which is too slow for startup.
+        return
+    try:
+        get_freelancer_index()
+    except DatabaseError:
+        # The first match request retries, e.g. once migrations have run.
+        pass
+
+
+def rebuild_freelancer_index():
+    global _index
+    index = fit_freelancer_index()
+    with _index_lock:
+        _index = index
+    return index
+
+
+def discard_freelancer_from_index(freelancer_id):
+    if _index is not None:
+        _index.remove([freelancer_id])
+
+
+def reset_freelancer_index():
+    global _index
+    with _index_lock:
+        _index = None
+
+
+PROJECT_TEXT_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "normalized_skills",
+    "category",
+    "status",
+    "updated_at",
+)
+
+
+class ProjectRows:
+    """One immutable version of the open-project matrix, IDs and skills; see FreelancerRows."""
+
+    def __init__(self, matrix, project_ids, skills):
+        self.matrix = matrix
+        self.project_ids = list(project_ids)
+        self.skills = list(skills)
+
+    def __len__(self):
+        return len(self.project_ids)
+
+
+class ProjectIndex:
+    """Fitted TF-IDF vocabulary plus vectors for open projects only.
+
+    Closed projects are dropped on sync, so a freelancer recommendation is one
+    transform and one sparse product against this matrix.
+    """
+
+    def __init__(self, vectorizer, matrix, project_ids, skills=None):
+        self.vectorizer = vectorizer
+        self.rows = ProjectRows(sparse.csr_matrix(matrix), project_ids, skills or [])
+        self._lock = threading.Lock()
+        # Project updated_at last applied, so overlapping syncs skip repeats.
+        self._applied = {}
+        self.built_at = time.monotonic()
+        self.synced_at = None
+
+    @classmethod
+    def build(cls, documents):
+        ids = [pid for pid, _, _ in documents]
+        texts = [text for _, text, _ in documents]
+        vectorizer = build_vectorizer()
+        if any(texts):
+            matrix = vectorizer.fit_transform(texts)
+        else:
+            vectorizer.fit(["empty"])
+            matrix = sparse.csr_matrix((len(ids), len(vectorizer.vocabulary_)))
+        return cls(vectorizer, matrix, ids, [skills for _, _, skills in documents])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def transform(self, texts):
+        return self.vectorizer.transform(texts)
+
+    def upsert(self, documents):
+        if not documents:
+            return
+        ids = [pid for pid, _, _ in documents]
+        vectors = self.transform([text for _, text, _ in documents])
+        with self._lock:
+            rows = self.rows
+            replaced = set(ids)
+            keep = [pos for pos, pid in enumerate(rows.project_ids) if pid not in replaced]
+            self.rows = ProjectRows(
+                sparse.vstack([rows.matrix[keep], vectors], format="csr"),
+                [rows.project_ids[pos] for pos in keep] + ids,
+                [rows.skills[pos] for pos in keep] + [skills for _, _, skills in documents],
+            )
+
+    def remove(self, project_ids):
+        with self._lock:
+            rows = self.rows
+            removed = set(project_ids) & set(rows.project_ids)
+            if not removed:
+                return
+            keep = [pos for pos, pid in enumerate(rows.project_ids) if pid not in removed]
+            self.rows = ProjectRows(
+                rows.matrix[keep],
+                [rows.project_ids[pos] for pos in keep],
+                [rows.skills[pos] for pos in keep],
+            )
+
+
+def project_documents(projects):
+    engine = MatchingEngine()
+    return [(p.id, engine._build_project_text(p), p.normalized_skills) for p in projects]
+
+
+def build_project_index():
+    synced_at = timezone.now()
+    projects = Project.objects.filter(status=Project.Status.OPEN).only(*PROJECT_TEXT_FIELDS)
+    index = ProjectIndex.build(project_documents(projects.order_by("id")))
+    index.synced_at = synced_at
+    return index
+
+
+def sync_project_index(index):
+    synced_at = timezone.now()
+    changed = [
+        project
+        for project in Project.objects.filter(updated_at__gte=sync_watermark(index)).only(
+            *PROJECT_TEXT_FIELDS
+        )
+        if index._applied.get(project.id) != project.updated_at
+    ]
+    index.upsert(project_documents([p for p in changed if p.status == Project.Status.OPEN]))
+    index.remove([p.id for p in changed if p.status != Project.Status.OPEN])
+    index._applied.update((p.id, p.updated_at) for p in changed)
+    open_projects = Project.objects.filter(status=Project.Status.OPEN)
+    if open_projects.count() != len(index):
+        current = set(open_projects.values_list("id", flat=True))
+        index.remove(set(index.rows.project_ids) - current)
+    index.synced_at = synced_at
+    return index
+
+
+_project_index = None
+_project_index_lock = threading.Lock()
+
+
+def get_project_index():
+    global _project_index
+    if _project_index is None or _is_expired(_project_index):
+        with _project_index_lock:
+            if _project_index is None or _is_expired(_project_index):
+                _project_index = build_project_index()
+                return _project_index
+    return sync_project_index(_project_index)
+
+
+def update_project_in_index(project):
+    if _project_index is None:
+        return
+    if project.status == Project.Status.OPEN:
+        _project_index.upsert(project_documents([project]))
+    else:
+        _project_index.remove([project.id])
+
+
+def discard_project_from_index(project_id):
+    if _project_index is not None:
+        _project_index.remove([project_id])
+
+
+def reset_project_index():
+    global _project_index
+    with _project_index_lock:
+        _project_index = None
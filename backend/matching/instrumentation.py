@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import connection
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class StageTimer:
+    """Collects wall time and query counts per named stage of one match run."""
+
+    def __init__(self):
+        self.stages = {}
+        self.queries = {}
+        self.counts = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        counter = _QueryCounter()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(counter):
+                yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+            self.queries[name] = self.queries.get(name, 0) + counter.count
+
+    def count(self, name, value):
+        # Streaming runs report per chunk, so counts accumulate over the run.
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    @property
+    def total(self):
+        return time.perf_counter() - self._started
+
+    def server_timing(self):
+        parts = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in self.stages.items()]
+        parts.append(f"total;dur={self.total * 1000:.2f}")
+        return ", ".join(parts)
+
+
+class StatsRegistry:
+    """Process-local aggregate of StageTimer results, keyed by endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self._endpoints = defaultdict(
+            lambda: {
+                "requests": 0,
+                "total_seconds": 0.0,
+                "max_seconds": 0.0,
+                "stages": defaultdict(lambda: {"seconds": 0.0, "max_seconds": 0.0, "queries": 0}),
+                "counts": defaultdict(int),
+            }
+        )
+
+    def record(self, endpoint, timer):
+        total = timer.total
+        with self._lock:
+            entry = self._endpoints[endpoint]
+            entry["requests"] += 1
+            entry["total_seconds"] += total
+            entry["max_seconds"] = max(entry["max_seconds"], total)
+            for name, seconds in timer.stages.items():
+                stage = entry["stages"][name]
+                stage["seconds"] += seconds
+                stage["max_seconds"] = max(stage["max_seconds"], seconds)
+                stage["queries"] += timer.queries.get(name, 0)
+            for name, value in timer.counts.items():
+                entry["counts"][name] += value
+
+    def snapshot(self):
+        with self._lock:
+            result = {}
+            for endpoint, entry in self._endpoints.items():
+                requests = entry["requests"]
+                result[endpoint] = {
+                    "requests": requests,
+                    "mean_ms": entry["total_seconds"] * 1000 / requests,
+                    "max_ms": entry["max_seconds"] * 1000,
+                    "stages": {
+                        name: {
+                            "mean_ms": stage["seconds"] * 1000 / requests,
+                            "max_ms": stage["max_seconds"] * 1000,
+                            "mean_queries": stage["queries"] / requests,
+                        }
+                        for name, stage in entry["stages"].items()
+                    },
+                    "mean_counts": {
+                        name: total / requests for name, total in entry["counts"].items()
+                    },
+                }
+            return result
+
+
+stats = StatsRegistry()
@@ -0,0 +1,182 @@
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from projects.models import Project, ProjectSkill
+from .cache import cached_matches
+from .models import Match, MatchJob
+from .services import (
+    load_freelancer_for_matching,
+    match_freelancer_projects,
+    match_project_freelancers,
+    match_projects,
+)
+
+
+def enqueue(kind, target_ids):
+    if not settings.MATCHING_PRECOMPUTE:
+        return
+    MatchJob.objects.bulk_create(
+        [MatchJob(kind=kind, target_id=target_id) for target_id in set(target_ids)],
+        ignore_conflicts=True,
+    )
+
+
+def enqueue_freelancer_change(freelancer_id):
+    """Queue the freelancer's own ranking and every project ranking they may enter or leave."""
+    if not settings.MATCHING_PRECOMPUTE:
+        return
+    enqueue(MatchJob.Kind.FREELANCER, [freelancer_id])
+    sharing_skill = ProjectSkill.objects.filter(
+        project__status=Project.Status.OPEN, skill__freelancer_links__freelancer_id=freelancer_id
+    ).values_list("project_id", flat=True)
+    ranked_in = Match.objects.filter(
+        source=Match.Source.PROJECT, freelancer_id=freelancer_id
+    ).values_list("project_id", flat=True)
+    enqueue(MatchJob.Kind.PROJECT, [*sharing_skill, *ranked_in])
+
+
+def enqueue_project_change(project_id):
+    """Queue the project's own ranking and every freelancer ranking that lists it."""
+    if not settings.MATCHING_PRECOMPUTE:
+        return
+    enqueue(MatchJob.Kind.PROJECT, [project_id])
+    # Rerunning a freelancer's ranking drops the project once it is closed.
+    listed_by = Match.objects.filter(
+        source=Match.Source.FREELANCER, project_id=project_id
+    ).values_list("freelancer_id", flat=True)
+    enqueue(MatchJob.Kind.FREELANCER, listed_by)
+
+
+def enqueue_project_change_on_commit(project_id):
+    transaction.on_commit(lambda: enqueue_project_change(project_id))
+
+
+def submit(kind, target_id, user, weights=None, top_n=20):
+    return MatchJob.objects.create(
+        kind=kind,
+        target_id=target_id,
+        requested_by=user,
+        params={"weights": weights, "top_n": top_n},
+    )
+
+
+def claim_jobs(kind, limit, requested=False):
+    now = timezone.now()
+    expired = Q(
+        status=MatchJob.Status.RUNNING,
+        started_at__lt=now - timedelta(seconds=settings.MATCHING_JOB_LEASE_SECONDS),
+    )
+    jobs = MatchJob.objects.filter(kind=kind, requested_by__isnull=not requested)
+    # Orphaned jobs that already used up their attempts are given up on, not retried.
+    jobs.filter(expired, attempts__gte=settings.MATCHING_JOB_MAX_ATTEMPTS).update(
+        status=MatchJob.Status.FAILED, error="Worker lease expired", finished_at=now
+    )
+    claimable = Q(status=MatchJob.Status.PENDING) | expired
+    candidate_ids = list(
+        jobs.filter(claimable).order_by("created_at", "id").values_list("id", flat=True)[:limit]
+    )
+    claimed = []
+    for job_id in candidate_ids:
+        # A conditional UPDATE is the claim, so concurrent workers never share a job.
+        updated = MatchJob.objects.filter(claimable, id=job_id).update(
+            status=MatchJob.Status.RUNNING, started_at=now, attempts=F("attempts") + 1
+        )
+        if updated:
+            claimed.append(job_id)
+    return list(MatchJob.objects.filter(id__in=claimed))
+
+
+def _finish(jobs, status, error=""):
+    MatchJob.objects.filter(id__in=[job.id for job in jobs]).update(
+        status=status, error=error, finished_at=timezone.now()
+    )
+
+
+def _run_project_jobs(jobs, top_n):
+    projects = Project.objects.filter(id__in=[job.target_id for job in jobs]).order_by("id")
+    match_projects(projects, top_n=top_n)
+
+
+def _run_freelancer_jobs(jobs, top_n):
+    for job in jobs:
+        freelancer = load_freelancer_for_matching(job.target_id)
+        if freelancer is not None:
+            match_freelancer_projects(freelancer, top_n=top_n)
+
+
+RUNNERS = {
+    MatchJob.Kind.PROJECT: _run_project_jobs,
+    MatchJob.Kind.FREELANCER: _run_freelancer_jobs,
+}
+
+
+def _project_result(project_id, weights, top_n):
+    project = Project.objects.filter(id=project_id).first()
+    if project is None:
+        raise LookupError(f"Project {project_id} not found")
+    matches = cached_matches(
+        "project",
+        project.id,
+        weights,
+        top_n,
+        lambda: match_project_freelancers(project, weights=weights, top_n=top_n),
+    )
+    return {"project_id": project.id, "matches": matches}
+
+
+def _freelancer_result(freelancer_id, weights, top_n):
+    freelancer = load_freelancer_for_matching(freelancer_id)
+    if freelancer is None:
+        raise LookupError(f"Freelancer {freelancer_id} not found")
+    matches = cached_matches(
+        "freelancer",
+        freelancer.id,
+        weights,
+        top_n,
+        lambda: match_freelancer_projects(freelancer, weights=weights, top_n=top_n),
+    )
+    return {"freelancer_id": freelancer.id, "matches": matches}
+
+
+REQUEST_RUNNERS = {
+    MatchJob.Kind.PROJECT: _project_result,
+    MatchJob.Kind.FREELANCER: _freelancer_result,
+}
+
+
+def run_requested_jobs(limit=10):
+    processed = 0
+    for kind, runner in REQUEST_RUNNERS.items():
+        for job in claim_jobs(kind, limit, requested=True):
+            try:
+                job.result = runner(job.target_id, job.params.get("weights"), job.params.get("top_n", 20))
+            except Exception:
+                _finish([job], MatchJob.Status.FAILED, traceback.format_exc())
+            else:
+                job.status = MatchJob.Status.DONE
+                job.finished_at = timezone.now()
+                job.save(update_fields=["result", "status", "finished_at"])
+            processed += 1
+    return processed
+
+
+def run_pending_jobs(batch_size=50, top_n=20):
+    # Jobs somebody is polling for go ahead of background recomputation.
+    processed = run_requested_jobs(batch_size)
+    for kind, runner in RUNNERS.items():
+        jobs = claim_jobs(kind, batch_size)
+        if not jobs:
+            continue
+        try:
+            runner(jobs, top_n)
+        except Exception:
+            _finish(jobs, MatchJob.Status.FAILED, traceback.format_exc())
+        else:
+            _finish(jobs, MatchJob.Status.DONE)
+        processed += len(jobs)
+    return processed
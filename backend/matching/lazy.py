@@ -0,0 +1,34 @@
+import importlib
+import threading
+
+
+class LazyModule:
+    """Module stand-in that imports ``name`` on first attribute access.
+
+    Keeps numpy, SciPy and scikit-learn out of Django startup; they load the
+    first time matching actually runs.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        with self._lock:
+            if self._module is None:
+                self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        module = self._module or self._load()
+        return getattr(module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+np = LazyModule("numpy")
+sparse = LazyModule("scipy.sparse")
+sklearn_text = LazyModule("sklearn.feature_extraction.text")
@@ -0,0 +1,199 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import sklearn
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.test import APIClient
+
+from accounts.models import FreelancerProfile
+from matching.benchmark import BENCH_DOMAIN, generate_dataset
+from matching.documents import rebuild_freelancer_documents
+from matching.engine import MatchingEngine
+from matching.index import (
+    rebuild_freelancer_index,
+    reset_freelancer_index,
+    reset_project_index,
+)
+from matching.models import Match
+from matching.services import FREELANCER_SCORING_FIELDS
+from projects.models import Project
+
+
+def _summary(samples):
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def _timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the matching engine on deterministic synthetic data. Runs in a "
+        "throwaway test database and writes JSON results for comparison between commits."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="1000,10000", help="Comma-separated freelancer pool sizes.")
+        parser.add_argument("--projects-per-freelancer", type=float, default=0.1)
+        parser.add_argument("--queries", type=int, default=20, help="Projects matched per stage.")
+        parser.add_argument("--requests", type=int, default=10, help="Requests per endpoint.")
+        parser.add_argument("--top-n", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", default="bench_results.json")
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options["sizes"].split(",") if size.strip()]
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            runs = [self._run_size(size, options) for size in sizes]
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            reset_freelancer_index()
+            reset_project_index()
+
+        report = {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "scikit_learn": sklearn.__version__,
+            "database": connection.vendor,
+            "seed": options["seed"],
+            "top_n": options["top_n"],
+            "runs": runs,
+        }
+        with open(options["output"], "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Wrote benchmark results to {options['output']}"))
+
+    def _run_size(self, size, options):
+        self.stdout.write(f"Benchmarking {size} freelancers...")
+        reset_freelancer_index()
+        reset_project_index()
+        call_command("flush", interactive=False, verbosity=0)
+
+        project_count = max(1, int(size * options["projects_per_freelancer"]))
+        _, generate_seconds = _timed(
+            generate_dataset, size, project_count, seed=options["seed"]
+        )
+
+        stages = {}
+        _, seconds = _timed(rebuild_freelancer_documents)
+        stages["text_build"] = _summary([seconds])
+
+        index, seconds = _timed(rebuild_freelancer_index)
+        stages["vectorize"] = _summary([seconds])
+
+        engine = MatchingEngine(index=index)
+        freelancers = list(
+            FreelancerProfile.objects.only(*FREELANCER_SCORING_FIELDS).order_by("id")
+        )
+        freelancer_ids = [f.id for f in freelancers]
+        freelancer_matrix = index.vectors_for(freelancer_ids)
+        exp_scores = engine._experience_scores(freelancers)
+        rating_scores = engine._rating_scores(freelancers)
+        weights = {"skill": 0.6, "experience": 0.3, "rating": 0.1}
+        projects = list(Project.objects.order_by("id")[: options["queries"]])
+
+        similarity_samples, scoring_samples, persistence_samples = [], [], []
+        for project in projects:
+            started = time.perf_counter()
+            project_vector = index.transform([engine._build_project_text(project)])
+            similarities = (freelancer_matrix @ project_vector.T).toarray().ravel()
+            similarity_samples.append(time.perf_counter() - started)
+
+            matches, seconds = _timed(
+                engine._rank_freelancers,
+                project,
+                freelancers,
+                similarities,
+                exp_scores,
+                rating_scores,
+                weights,
+                options["top_n"],
+            )
+            scoring_samples.append(seconds)
+
+            _, seconds = _timed(
+                Match.objects.bulk_upsert,
+                [
+                    Match(
+                        source=Match.Source.PROJECT,
+                        project=project,
+                        freelancer_id=item["freelancer_id"],
+                        match_score=item["score"],
+                        matched_skills=item["matched_skills"],
+                    )
+                    for item in matches
+                ],
+            )
+            persistence_samples.append(seconds)
+
+        stages["similarity"] = _summary(similarity_samples)
+        stages["scoring"] = _summary(scoring_samples)
+        stages["persistence"] = _summary(persistence_samples)
+
+        client = APIClient()
+        staff = get_user_model().objects.create_user(
+            username="bench-staff",
+            email=f"staff@{BENCH_DOMAIN}",
+            password=None,
+            role=get_user_model().Role.CLIENT,
+            is_staff=True,
+        )
+        client.force_authenticate(staff)
+        endpoints = {}
+        for name, paths in (
+            ("match_project", [f"/api/match/project/{p.id}" for p in projects]),
+            ("match_freelancer", [f"/api/match/freelancer/{fid}" for fid in freelancer_ids]),
+        ):
+            samples = []
+            for path in paths[: options["requests"]]:
+                response, seconds = _timed(
+                    client.post, path, {"top_n": options["top_n"]}, format="json"
+                )
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} returned {response.status_code}")
+                samples.append(seconds)
+            endpoints[name] = _summary(samples)
+
+        return {
+            "freelancers": size,
+            "projects": project_count,
+            "generate_seconds": generate_seconds,
+            "stages": stages,
+            "endpoints": endpoints,
+        }
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from matching.artifacts import publish_index_artifact
+from matching.index import fit_freelancer_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Fit the freelancer index from the database and publish it as a memory-mappable "
+        "artifact, atomically replacing the current one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", default=settings.MATCHING_ARTIFACT_DIR, help="Artifact directory.")
+        parser.add_argument("--keep", type=int, default=2, help="Releases to keep on disk.")
+
+    def handle(self, *args, **options):
+        if not options["dir"]:
+            raise CommandError("Set MATCHING_ARTIFACT_DIR or pass --dir.")
+
+        index = fit_freelancer_index()
+        release = publish_index_artifact(index, options["dir"], keep=max(1, options["keep"]))
+        self.stdout.write(
+            self.style.SUCCESS(f"Published {len(index)} freelancer vectors to {release}.")
+        )
@@ -0,0 +1,38 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from matching.ann import measure_recall
+from matching.engine import MatchingEngine
+from matching.index import build_freelancer_index
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Measure approximate-search recall and latency against exact cosine matching."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sample", type=int, default=100, help="Number of open projects to query.")
+        parser.add_argument("--k", type=int, default=20)
+        parser.add_argument("--tables", type=int, default=None)
+        parser.add_argument("--bits", type=int, default=None)
+        parser.add_argument("--probe-radius", type=int, default=None)
+
+    def handle(self, *args, **options):
+        index = build_freelancer_index()
+        index.enable_ann(n_tables=options["tables"], n_bits=options["bits"])
+
+        engine = MatchingEngine()
+        projects = Project.objects.filter(status=Project.Status.OPEN).order_by("-created_at")
+        texts = [engine._build_project_text(p) for p in projects[: options["sample"]]]
+        if not texts:
+            self.stdout.write(self.style.WARNING("No open projects to query."))
+            return
+
+        report = measure_recall(
+            index, index.transform(texts), k=options["k"], probe_radius=options["probe_radius"]
+        )
+        report.update(
+            tables=index.ann.n_tables, bits=index.ann.n_bits, probe_radius=options["probe_radius"]
+        )
+        self.stdout.write(json.dumps(report, indent=2))
@@ -0,0 +1,138 @@
+import random
+import re
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import ClientProfile, FreelancerProfile
+from applications.models import Application
+from matching.benchmark import generate_dataset
+from projects.models import Project
+from projects.search import get_search_backend
+
+# (label, role, URL) for every list query pattern the viewsets serve.
+LIST_QUERIES = [
+    ("projects: client's own", "client", "/api/projects/"),
+    ("projects: open", "freelancer", "/api/projects/"),
+    ("projects: open, next page", "freelancer", "/api/projects/?cursor=next"),
+    ("projects: status", "client", "/api/projects/?status=open"),
+    ("projects: category", "freelancer", "/api/projects/?category=backend"),
+    ("projects: budget", "freelancer", "/api/projects/?budget_min=2000&budget_max=4000"),
+    ("projects: skills", "freelancer", "/api/projects/?skills=python,django"),
+    ("projects: search", "freelancer", "/api/projects/?q=payments"),
+    ("projects: search, next page", "freelancer", "/api/projects/?q=payments&cursor=next"),
+    ("applications: freelancer's own", "freelancer", "/api/applications/"),
+    ("applications: client's projects", "client", "/api/applications/"),
+    ("freelancers: directory", "freelancer", "/api/users/freelancers/"),
+    ("freelancers: next page", "freelancer", "/api/users/freelancers/?cursor=next"),
+    ("freelancers: experience", "client", "/api/users/freelancers/?experience_level=senior"),
+    ("freelancers: rate", "client", "/api/users/freelancers/?hourly_rate_min=40&hourly_rate_max=60"),
+    ("freelancers: skills", "client", "/api/users/freelancers/?skills=python"),
+]
+
+# SQLite reports a full table scan as a bare "SCAN <table>"; "SCAN t USING INDEX" walks an index.
+SQLITE_FULL_SCAN = re.compile(r"\bSCAN (\w+)$")
+
+
+def _explain(sql):
+    with transaction.atomic(), connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            # Tiny tables make seq scans cheapest; disabling them shows whether an index is usable.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN {sql}")
+        else:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [" ".join(str(column) for column in row) for row in cursor.fetchall()]
+
+
+def _problems(plan):
+    problems = []
+    for line in plan:
+        if connection.vendor == "postgresql":
+            if "Seq Scan" in line:
+                problems.append(line.strip())
+        else:
+            match = SQLITE_FULL_SCAN.search(line)
+            if match and not match.group(1).startswith("sqlite_"):
+                problems.append(line.strip())
+    return problems
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN every project, application and freelancer list query on synthetic data "
+        "in a throwaway test database and fail if any of them scans a table without an index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--freelancers", type=int, default=500)
+        parser.add_argument("--projects", type=int, default=200)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--verbose-plans", action="store_true", help="Print every plan.")
+
+    def handle(self, *args, **options):
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            self._populate(options)
+            failures = self._check(options["verbose_plans"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        if failures:
+            raise CommandError(f"{failures} list queries scan a table without an index")
+        self.stdout.write(self.style.SUCCESS("Every list query uses an index."))
+
+    def _populate(self, options):
+        generate_dataset(options["freelancers"], options["projects"], seed=options["seed"])
+        # bulk_create skips the save signals that keep the search index current.
+        get_search_backend().rebuild()
+        rng = random.Random(options["seed"])
+        projects = list(Project.objects.only("id"))
+        # Most real projects are closed, so status is a selective filter.
+        closed = [project.id for project in projects if rng.random() < 0.7]
+        Project.objects.filter(id__in=closed).update(status=Project.Status.CLOSED)
+
+        freelancers = list(FreelancerProfile.objects.only("id"))
+        Application.objects.bulk_create(
+            [
+                Application(project=project, freelancer=freelancer, proposed_rate=Decimal(50))
+                for project in projects
+                for freelancer in rng.sample(freelancers, min(5, len(freelancers)))
+            ]
+        )
+
+    def _check(self, verbose):
+        users = {
+            "client": ClientProfile.objects.select_related("user").first().user,
+            "freelancer": FreelancerProfile.objects.select_related("user").first().user,
+        }
+        client = APIClient()
+        failures = 0
+        for label, role, url in LIST_QUERIES:
+            client.force_authenticate(users[role])
+            if "cursor=next" in url:
+                url = client.get(url.replace("cursor=next", "page_size=5")).data["next"]
+                if url is None:
+                    raise CommandError(f"{label}: the first page has no next page")
+            with CaptureQueriesContext(connection) as captured:
+                response = client.get(url)
+            if response.status_code != 200:
+                raise CommandError(f"{label}: GET {url} returned {response.status_code}")
+
+            problems = []
+            for query in captured.captured_queries:
+                if query["sql"].startswith("SELECT"):
+                    plan = _explain(query["sql"])
+                    problems += _problems(plan)
+                    if verbose:
+                        self.stdout.write(f"  {query['sql']}\n    " + "\n    ".join(plan))
+            if problems:
+                failures += 1
+                self.stdout.write(self.style.ERROR(f"FAIL {label}: {'; '.join(problems)}"))
+            else:
+                self.stdout.write(f"ok   {label}")
+        return failures
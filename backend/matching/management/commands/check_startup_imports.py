@@ -0,0 +1,75 @@
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def _profile_startup():
+    script = f"import django; django.setup(); import {settings.ROOT_URLCONF}"
+    env = dict(os.environ)
+    env.setdefault("DJANGO_SETTINGS_MODULE", "skillsync.settings")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise CommandError(f"Startup failed:\n{completed.stderr[-2000:]}")
+
+    modules = {}
+    top_level = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        modules[name] = int(cumulative)
+        if not indent:
+            top_level[name] = int(cumulative)
+    return modules, top_level
+
+
+class Command(BaseCommand):
+    help = (
+        "Profile Django startup plus URLconf import with `python -X importtime` and fail "
+        "if heavy matching dependencies load or the time budget is exceeded."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument(
+            "--forbid",
+            default="numpy,scipy,sklearn",
+            help="Comma-separated top-level packages that must not be imported at startup.",
+        )
+        parser.add_argument("--budget-ms", type=float, default=0, help="Fail above this median; 0 disables.")
+        parser.add_argument("--top", type=int, default=10)
+
+    def handle(self, *args, **options):
+        forbidden = {name.strip() for name in options["forbid"].split(",") if name.strip()}
+        totals = []
+        for _ in range(max(1, options["runs"])):
+            modules, top_level = _profile_startup()
+            totals.append(sum(top_level.values()) / 1000)
+
+        median_ms = statistics.median(totals)
+        self.stdout.write(f"Startup imports: median {median_ms:.1f} ms over {len(totals)} runs")
+        for name, micros in sorted(top_level.items(), key=lambda item: -item[1])[: options["top"]]:
+            self.stdout.write(f"  {micros / 1000:8.1f} ms  {name}")
+
+        loaded = sorted(name for name in modules if name.split(".")[0] in forbidden)
+        if loaded:
+            raise CommandError(f"Heavy modules imported at startup: {', '.join(loaded[:10])}")
+        if options["budget_ms"] and median_ms > options["budget_ms"]:
+            raise CommandError(
+                f"Startup imports took {median_ms:.1f} ms, over the {options['budget_ms']} ms budget"
+            )
+        self.stdout.write(self.style.SUCCESS("Startup imports are within limits."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from matching.documents import rebuild_freelancer_documents
+
+
+class Command(BaseCommand):
+    help = "Rebuild the cached freelancer match documents from profiles and resumes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        total = rebuild_freelancer_documents(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} freelancer match documents."))
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+from matching.parallel import ShardedScorer
+from matching.services import match_projects
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Recompute and store freelancer matches for projects in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--status", default=Project.Status.OPEN, help="Project status to refresh, or 'all'.")
+        parser.add_argument("--top-n", type=int, default=20)
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Scoring processes; defaults to MATCHING_PARALLEL_WORKERS.",
+        )
+        parser.add_argument(
+            "--min-candidates", type=int, default=0, help="Pool size below which --workers stays serial."
+        )
+
+    def handle(self, *args, **options):
+        projects = Project.objects.order_by("id")
+        if options["status"] != "all":
+            projects = projects.filter(status=options["status"])
+
+        executor = None
+        if options["workers"] is not None:
+            executor = ShardedScorer(options["workers"], options["min_candidates"])
+
+        batch_size = max(1, options["batch_size"])
+        project_ids = list(projects.values_list("id", flat=True))
+        for start in range(0, len(project_ids), batch_size):
+            batch = Project.objects.filter(id__in=project_ids[start : start + batch_size]).order_by("id")
+            match_projects(batch, top_n=options["top_n"], executor=executor)
+        if executor is not None:
+            executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f"Refreshed matches for {len(project_ids)} projects."))
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from matching.jobs import run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = "Process queued match recomputation jobs from the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit.")
+        parser.add_argument("--sleep", type=float, default=2.0, help="Seconds to wait when idle.")
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--top-n", type=int, default=20)
+
+    def handle(self, *args, **options):
+        while True:
+            processed = run_pending_jobs(batch_size=options["batch_size"], top_n=options["top_n"])
+            if processed:
+                self.stdout.write(f"Processed {processed} match jobs.")
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["sleep"])
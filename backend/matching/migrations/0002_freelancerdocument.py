@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_resume_resumelink_resumeexperience_resumeeducation_and_more'),
+        ('matching', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FreelancerDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text', models.TextField(blank=True)),
+                ('resume_updated_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('freelancer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='match_document', to='accounts.freelancerprofile')),
+            ],
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:15
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def remove_duplicate_matches(apps, schema_editor):
+    Match = apps.get_model('matching', 'Match')
+    duplicates = (
+        Match.objects.values('project_id', 'freelancer_id')
+        .annotate(keep_id=Max('id'), total=models.Count('id'))
+        .filter(total__gt=1)
+    )
+    for row in duplicates:
+        Match.objects.filter(
+            project_id=row['project_id'], freelancer_id=row['freelancer_id']
+        ).exclude(id=row['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0002_freelancerdocument'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_matches, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='match',
+            name='calculated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddConstraint(
+            model_name='match',
+            constraint=models.UniqueConstraint(fields=('project', 'freelancer'), name='unique_match_project_freelancer'),
+        ),
+    ]
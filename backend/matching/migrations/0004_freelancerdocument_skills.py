@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:17
+
+import re
+
+from django.db import migrations, models
+
+# Frozen copy of matching.skills.normalize_skills, so later edits there cannot change history.
+SKILL_MAP = {
+    "reactjs": "react",
+    "react.js": "react",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "typescript": "typescript",
+    "js": "javascript",
+    "py": "python",
+}
+NON_SKILL_CHARS = re.compile(r"[^a-z0-9.+#]")
+
+
+def normalize_skills(skills):
+    normalized = set()
+    for skill in skills or []:
+        if skill:
+            cleaned = NON_SKILL_CHARS.sub("", skill.lower().strip())
+            normalized.add(SKILL_MAP.get(cleaned, cleaned))
+    normalized.discard("")
+    return sorted(normalized)
+
+
+def backfill_document_skills(apps, schema_editor):
+    FreelancerDocument = apps.get_model('matching', 'FreelancerDocument')
+    documents = list(FreelancerDocument.objects.select_related('freelancer'))
+    for document in documents:
+        document.skills = normalize_skills(document.freelancer.skills)
+    FreelancerDocument.objects.bulk_update(documents, ['skills'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0003_match_unique_project_freelancer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='freelancerdocument',
+            name='skills',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.RunPython(backfill_document_skills, migrations.RunPython.noop),
+    ]
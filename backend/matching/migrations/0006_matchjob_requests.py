@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:31
+
+from django.conf import settings
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('matching', '0005_matchjob'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='matchjob',
+            name='unique_pending_match_job',
+        ),
+        migrations.AddField(
+            model_name='matchjob',
+            name='params',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='matchjob',
+            name='requested_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='match_jobs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='matchjob',
+            name='result',
+            field=models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='matchjob',
+            constraint=models.UniqueConstraint(condition=models.Q(('requested_by__isnull', True), ('status', 'pending')), fields=('kind', 'target_id'), name='unique_pending_match_job'),
+        ),
+    ]
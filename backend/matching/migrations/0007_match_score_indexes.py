@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0006_matchjob_requests'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['project', '-match_score'], name='match_project_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['freelancer', '-match_score'], name='match_freelancer_score_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0007_match_score_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='match',
+            name='unique_match_project_freelancer',
+        ),
+        migrations.RemoveIndex(
+            model_name='match',
+            name='match_project_score_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='match',
+            name='match_freelancer_score_idx',
+        ),
+        migrations.AddField(
+            model_name='match',
+            name='source',
+            field=models.CharField(choices=[('project', 'Project'), ('freelancer', 'Freelancer')], default='project', max_length=20),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['source', 'project', '-match_score'], name='match_project_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['source', 'freelancer', '-match_score'], name='match_freelancer_score_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='match',
+            constraint=models.UniqueConstraint(fields=('source', 'project', 'freelancer'), name='unique_match_source_project_freelancer'),
+        ),
+    ]
@@ -1,14 +1,110 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from accounts.models import FreelancerProfile
 from projects.models import Project
 
 
+class MatchQuerySet(models.QuerySet):
+    def bulk_upsert(self, matches):
+        return self.bulk_create(
+            matches,
+            update_conflicts=True,
+            unique_fields=["source", "project", "freelancer"],
+            update_fields=["match_score", "matched_skills", "calculated_at"],
+        )
+
+
 class Match(models.Model):
+    # Project-side and freelancer-side runs score against different corpora, so their
+    # scores are not comparable and each side keeps its own rows.
+    class Source(models.TextChoices):
+        PROJECT = "project", "Project"
+        FREELANCER = "freelancer", "Freelancer"
+
+    source = models.CharField(max_length=20, choices=Source.choices, default=Source.PROJECT)
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="matches")
     freelancer = models.ForeignKey(FreelancerProfile, on_delete=models.CASCADE, related_name="matches")
     match_score = models.FloatField()
     matched_skills = models.JSONField(default=list, blank=True)
-    calculated_at = models.DateTimeField(auto_now_add=True)
+    calculated_at = models.DateTimeField(auto_now=True)
+
+    objects = MatchQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Stored rankings are read best-first per project and per freelancer.
+            models.Index(
+                fields=["source", "project", "-match_score"], name="match_project_score_idx"
+            ),
+            models.Index(
+                fields=["source", "freelancer", "-match_score"], name="match_freelancer_score_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "project", "freelancer"],
+                name="unique_match_source_project_freelancer",
+            )
+        ]
 
     def __str__(self):
         return f"{self.project.title} -> {self.freelancer.name} ({self.match_score})"
+
+
+class FreelancerDocument(models.Model):
+    freelancer = models.OneToOneField(
+        FreelancerProfile, on_delete=models.CASCADE, related_name="match_document"
+    )
+    text = models.TextField(blank=True)
+    skills = models.JSONField(default=list, blank=True)
+    resume_updated_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    def __str__(self):
+        return f"Match document for freelancer {self.freelancer_id}"
+
+
+class MatchJob(models.Model):
+    class Kind(models.TextChoices):
+        PROJECT = "project", "Project"
+        FREELANCER = "freelancer", "Freelancer"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    target_id = models.BigIntegerField()
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Set for jobs submitted through the API, which keep their own parameters and result.
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="match_jobs",
+    )
+    params = models.JSONField(default=dict, blank=True)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "created_at"])]
+        constraints = [
+            # At most one queued recomputation per target; repeated edits coalesce into it.
+            models.UniqueConstraint(
+                fields=["kind", "target_id"],
+                condition=models.Q(status="pending", requested_by__isnull=True),
+                name="unique_pending_match_job",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.target_id} ({self.status})"
@@ -0,0 +1,106 @@
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+
+from .engine import top_n_indices
+from .lazy import np
+
+
+def _score_shard(project_matrix, freelancer_matrix, exp_scores, rating_scores, weights, top_n, offset):
+    """Local top-N per project row for one contiguous slice of the freelancer pool."""
+    similarity_matrix = (project_matrix @ freelancer_matrix.T).tocsr()
+    base = weights["experience"] * exp_scores + weights["rating"] * rating_scores
+    results = []
+    for row in range(project_matrix.shape[0]):
+        similarities = similarity_matrix[row].toarray().ravel()
+        scores = weights["skill"] * similarities + base
+        top = top_n_indices(scores, top_n)
+        results.append((top + offset, scores[top], similarities[top]))
+    return results
+
+
+class ShardedScorer:
+    """Scores a freelancer matrix in ID-range shards across a process pool.
+
+    Pools smaller than ``min_candidates``, or a scorer with fewer than two
+    workers, run the same shard function inline. Shards are merged in position
+    order, so ties break exactly as in the serial path.
+    """
+
+    def __init__(self, workers=0, min_candidates=0):
+        self.workers = workers
+        self.min_candidates = min_candidates
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def is_parallel(self, pool_size):
+        return self.workers > 1 and pool_size >= self.min_candidates
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                # Spawned workers only run numpy code; forking would copy DB connections.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def rank(self, project_matrix, freelancer_matrix, exp_scores, rating_scores, weights, top_n):
+        """Return ``(positions, scores, similarities)`` per project row, best first."""
+        pool_size = freelancer_matrix.shape[0]
+        if not self.is_parallel(pool_size):
+            return _score_shard(
+                project_matrix, freelancer_matrix, exp_scores, rating_scores, weights, top_n, 0
+            )
+
+        bounds = np.linspace(0, pool_size, self.workers + 1, dtype=np.int64)
+        pool = self._get_pool()
+        futures = [
+            pool.submit(
+                _score_shard,
+                project_matrix,
+                freelancer_matrix[start:end],
+                exp_scores[start:end],
+                rating_scores[start:end],
+                weights,
+                top_n,
+                int(start),
+            )
+            for start, end in zip(bounds[:-1], bounds[1:])
+            if end > start
+        ]
+        shards = [future.result() for future in futures]
+
+        merged = []
+        for row in range(project_matrix.shape[0]):
+            positions = np.concatenate([shard[row][0] for shard in shards])
+            scores = np.concatenate([shard[row][1] for shard in shards])
+            similarities = np.concatenate([shard[row][2] for shard in shards])
+            top = top_n_indices(scores, top_n)
+            merged.append((positions[top], scores[top], similarities[top]))
+        return merged
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_scoring_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ShardedScorer(
+                workers=settings.MATCHING_PARALLEL_WORKERS,
+                min_candidates=settings.MATCHING_PARALLEL_MIN_CANDIDATES,
+            )
+            atexit.register(_executor.shutdown)
+        return _executor
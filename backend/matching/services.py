@@ -0,0 +1,227 @@
+from django.conf import settings
+from django.db import transaction
+
+from accounts.models import FreelancerProfile
+from projects.models import Project
+from .documents import refresh_freelancer_documents
+from .engine import MatchingEngine, NullTimer
+from .index import get_freelancer_index, get_project_index
+from .models import Match
+from .parallel import get_scoring_executor
+
+FREELANCER_SCORING_FIELDS = (
+    "id",
+    "name",
+    "skills",
+    "normalized_skills",
+    "experience_level",
+    "hourly_rate",
+    "rating",
+)
+
+
+FREELANCER_SUMMARY_FIELDS = ("id", "name", "experience_level", "hourly_rate", "rating", "skills")
+PROJECT_SUMMARY_FIELDS = ("id", "title", "budget_min", "budget_max", "category", "required_skills")
+
+
+def freelancer_summary(freelancer):
+    return {
+        "id": freelancer.id,
+        "name": freelancer.name,
+        "experience_level": freelancer.experience_level,
+        "hourly_rate": freelancer.hourly_rate,
+        "rating": freelancer.rating,
+        "skills": freelancer.skills,
+    }
+
+
+def project_summary(project):
+    return {
+        "id": project.id,
+        "title": project.title,
+        "budget_min": project.budget_min,
+        "budget_max": project.budget_max,
+        "category": project.category,
+        "required_skills": project.required_skills,
+    }
+
+
+def persist_project_matches(results_by_project):
+    """Replace each project's stored ranking with its new result."""
+    stored = Match.objects.filter(source=Match.Source.PROJECT)
+    with transaction.atomic():
+        for project_id, matches in results_by_project.items():
+            stored.filter(project_id=project_id).exclude(
+                freelancer_id__in=[item["freelancer_id"] for item in matches]
+            ).delete()
+        Match.objects.bulk_upsert(
+            [
+                Match(
+                    source=Match.Source.PROJECT,
+                    project_id=project_id,
+                    freelancer_id=item["freelancer_id"],
+                    match_score=item["score"],
+                    matched_skills=item["matched_skills"],
+                )
+                for project_id, matches in results_by_project.items()
+                for item in matches
+            ]
+        )
+
+
+def persist_freelancer_matches(freelancer, matches):
+    """Replace the freelancer's stored ranking with its new result."""
+    with transaction.atomic():
+        Match.objects.filter(source=Match.Source.FREELANCER, freelancer=freelancer).exclude(
+            project_id__in=[item["project_id"] for item in matches]
+        ).delete()
+        Match.objects.bulk_upsert(
+            [
+                Match(
+                    source=Match.Source.FREELANCER,
+                    project_id=item["project_id"],
+                    freelancer=freelancer,
+                    match_score=item["score"],
+                    matched_skills=item["matched_skills"],
+                )
+                for item in matches
+            ]
+        )
+
+
+def iter_freelancer_chunks(queryset, chunk_size, timer=None, ids=None):
+    """Yield lists of at most ``chunk_size`` freelancers, paging by primary key.
+
+    With ``ids``, only those freelancers are loaded, one ID slice per query.
+    """
+    timer = timer or NullTimer()
+    if ids is not None:
+        ids = sorted(ids)
+        for start in range(0, len(ids), chunk_size):
+            with timer.stage("load_candidates"):
+                chunk = list(queryset.filter(id__in=ids[start : start + chunk_size]).order_by("id"))
+            if chunk:
+                yield chunk
+        return
+
+    last_id = 0
+    while True:
+        with timer.stage("load_candidates"):
+            chunk = list(queryset.filter(id__gt=last_id).order_by("id")[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1].id
+
+
+def match_project_freelancers(project, weights=None, top_n=20, persist=True, timer=None):
+    timer = timer or NullTimer()
+    with timer.stage("index_sync"):
+        index = get_freelancer_index()
+    executor = get_scoring_executor()
+    engine = MatchingEngine(index=index, timer=timer, executor=executor)
+    with timer.stage("candidate_filter"):
+        # Documents come from the index, so only the scoring fields are loaded here.
+        freelancers = FreelancerProfile.objects.only(*FREELANCER_SCORING_FIELDS).order_by("id")
+        candidate_ids = index.candidate_ids(project.normalized_skills)
+    if settings.MATCHING_SEARCH_MODE == "ann":
+        # One LSH lookup per request; freelancers outside its buckets are never loaded.
+        ann_ids = engine.ann_candidate_ids(project)
+        candidate_ids = ann_ids if candidate_ids is None else ann_ids.intersection(candidate_ids)
+
+    pool_size = len(index) if candidate_ids is None else len(candidate_ids)
+    chunk_size = settings.MATCHING_STREAM_CHUNK_SIZE
+    # Pools large enough for the process pool are scored whole, across workers.
+    if chunk_size > 0 and not executor.is_parallel(pool_size):
+        matches = engine.match_project_to_freelancer_chunks(
+            project,
+            iter_freelancer_chunks(freelancers, chunk_size, timer, ids=candidate_ids),
+            weights=weights,
+            top_n=top_n,
+        )
+    else:
+        if candidate_ids is not None:
+            freelancers = freelancers.filter(id__in=candidate_ids)
+        with timer.stage("load_candidates"):
+            freelancers = list(freelancers)
+        matches = engine.match_project_to_freelancers(project, freelancers, weights=weights, top_n=top_n)
+
+    if persist:
+        with timer.stage("persist"):
+            persist_project_matches({project.id: matches})
+
+    # Summaries are loaded for the winners only, not kept for the whole pool.
+    winners = FreelancerProfile.objects.only(*FREELANCER_SCORING_FIELDS).in_bulk(
+        [item["freelancer_id"] for item in matches]
+    )
+    for item in matches:
+        item["freelancer"] = freelancer_summary(winners[item["freelancer_id"]])
+    return matches
+
+
+def match_projects(projects, weights=None, top_n=20, persist=True, timer=None, executor=None):
+    timer = timer or NullTimer()
+    with timer.stage("index_sync"):
+        index = get_freelancer_index()
+    with timer.stage("load_candidates"):
+        # Batch runs rank each project against the whole pool with one sparse product.
+        freelancers = list(
+            FreelancerProfile.objects.only(*FREELANCER_SCORING_FIELDS).order_by("id")
+        )
+    engine = MatchingEngine(index=index, timer=timer, executor=executor or get_scoring_executor())
+    results = engine.match_projects_to_freelancers(
+        projects, freelancers, weights=weights, top_n=top_n
+    )
+
+    if persist:
+        with timer.stage("persist"):
+            persist_project_matches(results)
+
+    freelancer_map = {f.id: f for f in freelancers}
+    for matches in results.values():
+        for item in matches:
+            item["freelancer"] = freelancer_summary(freelancer_map[item["freelancer_id"]])
+    return results
+
+
+def load_freelancer_for_matching(freelancer_id):
+    # The stored document replaces the resume prefetches; user_id is for permission checks.
+    return (
+        FreelancerProfile.objects.select_related("match_document")
+        .only(*FREELANCER_SCORING_FIELDS, "user_id", "match_document__text")
+        .filter(id=freelancer_id)
+        .first()
+    )
+
+
+def freelancer_document_text(freelancer):
+    try:
+        return freelancer.match_document.text
+    except FreelancerProfile.match_document.RelatedObjectDoesNotExist:
+        # Written by the profile signals; only rows saved around them lack one.
+        return refresh_freelancer_documents([freelancer.id])[0].text
+
+
+def match_freelancer_projects(freelancer, weights=None, top_n=20, persist=True, timer=None):
+    timer = timer or NullTimer()
+    with timer.stage("index_sync"):
+        project_index = get_project_index()
+    engine = MatchingEngine(timer=timer, project_index=project_index)
+    with timer.stage("text_build"):
+        freelancer_text = freelancer_document_text(freelancer)
+    matches = engine.match_freelancer_to_indexed_projects(
+        freelancer, freelancer_text, weights=weights, top_n=top_n
+    )
+
+    if persist:
+        with timer.stage("persist"):
+            persist_freelancer_matches(freelancer, matches)
+
+    with timer.stage("load_candidates"):
+        # Only the winners are loaded, for their summaries.
+        projects = Project.objects.only(*PROJECT_SUMMARY_FIELDS).in_bulk(
+            [item["project_id"] for item in matches]
+        )
+    for item in matches:
+        item["project"] = project_summary(projects[item["project_id"]])
+    return matches
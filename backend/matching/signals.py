@@ -0,0 +1,96 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from accounts.models import (
+    FreelancerProfile,
+    Resume,
+    ResumeCertification,
+    ResumeEducation,
+    ResumeExperience,
+    ResumeLink,
+)
+from projects.models import Project
+from .cache import bump_corpus_version
+from .documents import refresh_freelancer_documents
+from .index import (
+    discard_freelancer_from_index,
+    discard_project_from_index,
+    update_project_in_index,
+)
+from .jobs import enqueue_freelancer_change
+
+RESUME_CHILD_MODELS = (ResumeExperience, ResumeEducation, ResumeCertification, ResumeLink)
+
+
+def _refresh_freelancer(freelancer_id):
+    # Rating and experience change scores even when the document text does not.
+    bump_corpus_version()
+    if refresh_freelancer_documents([freelancer_id]):
+        enqueue_freelancer_change(freelancer_id)
+
+
+def _schedule_refresh(freelancer_id):
+    # Deferred so cascaded deletes have finished before the document is rebuilt.
+    transaction.on_commit(lambda: _refresh_freelancer(freelancer_id))
+
+
+@receiver(post_save, sender=FreelancerProfile)
+def freelancer_profile_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _schedule_refresh(instance.pk)
+
+
+@receiver(post_delete, sender=FreelancerProfile)
+def freelancer_profile_deleted(sender, instance, **kwargs):
+    discard_freelancer_from_index(instance.pk)
+    transaction.on_commit(bump_corpus_version)
+
+
+@receiver(post_save, sender=Resume)
+def resume_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _schedule_refresh(instance.freelancer_id)
+
+
+def resume_child_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    # Child rows do not touch the parent, so bump Resume.updated_at ourselves.
+    resume = Resume.objects.filter(pk=instance.resume_id)
+    resume.update(updated_at=timezone.now())
+    freelancer_id = resume.values_list("freelancer_id", flat=True).first()
+    if freelancer_id is not None:
+        _schedule_refresh(freelancer_id)
+
+
+for model in RESUME_CHILD_MODELS:
+    post_save.connect(resume_child_changed, sender=model, dispatch_uid=f"match-doc-save-{model.__name__}")
+    post_delete.connect(resume_child_changed, sender=model, dispatch_uid=f"match-doc-delete-{model.__name__}")
+
+
+@receiver(post_save, sender=Project)
+def project_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+
+    def refresh():
+        # Creating, editing, closing or reopening all land here, so the open-project index follows.
+        update_project_in_index(instance)
+        bump_corpus_version()
+
+    transaction.on_commit(refresh)
+
+
+@receiver(post_delete, sender=Project)
+def project_deleted(sender, instance, **kwargs):
+    project_id = instance.pk
+
+    def refresh():
+        discard_project_from_index(project_id)
+        bump_corpus_version()
+
+    transaction.on_commit(refresh)
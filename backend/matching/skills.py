@@ -0,0 +1,29 @@
+import re
+from functools import lru_cache
+
+SKILL_MAP = {
+    "reactjs": "react",
+    "react.js": "react",
+    "nodejs": "node.js",
+    "node": "node.js",
+    "typescript": "typescript",
+    "js": "javascript",
+    "py": "python",
+}
+
+_NON_SKILL_CHARS = re.compile(r"[^a-z0-9.+#]")
+
+
+@lru_cache(maxsize=4096)
+def normalize_skill(skill: str) -> str:
+    cleaned = _NON_SKILL_CHARS.sub("", skill.lower().strip())
+    return SKILL_MAP.get(cleaned, cleaned)
+
+
+def normalize_skills(skills):
+    if not skills:
+        return []
+    normalized = {normalize_skill(s) for s in skills if s}
+    # Blank or punctuation-only entries normalize to "" and are not skills.
+    normalized.discard("")
+    return sorted(normalized)
@@ -1,7 +1,26 @@
 from django.urls import path
-from .views import match_project, match_freelancer
+from .views import (
+    freelancer_matches,
+    match_freelancer,
+    match_freelancer_async,
+    match_job,
+    match_project,
+    match_project_async,
+    match_projects_batch,
+    match_stats,
+    project_matches,
+    rebuild_index,
+)
 
 urlpatterns = [
     path("project/<int:project_id>", match_project, name="match-project"),
+    path("project/<int:project_id>/matches", project_matches, name="project-matches"),
+    path("project/<int:project_id>/jobs", match_project_async, name="match-project-async"),
+    path("projects", match_projects_batch, name="match-projects"),
     path("freelancer/<int:freelancer_id>", match_freelancer, name="match-freelancer"),
+    path("freelancer/<int:freelancer_id>/matches", freelancer_matches, name="freelancer-matches"),
+    path("freelancer/<int:freelancer_id>/jobs", match_freelancer_async, name="match-freelancer-async"),
+    path("jobs/<int:job_id>", match_job, name="match-job"),
+    path("index/rebuild", rebuild_index, name="match-index-rebuild"),
+    path("stats", match_stats, name="match-stats"),
 ]
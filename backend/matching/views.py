@@ -1,11 +1,27 @@
+from django.conf import settings
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from accounts.models import FreelancerProfile
 from projects.models import Project
-from .engine import MatchingEngine
-from .models import Match
+from .cache import bump_corpus_version, cached_matches
+from .index import rebuild_freelancer_index
+from .instrumentation import StageTimer, stats
+from .jobs import submit
+from .models import Match, MatchJob
+from .pagination import MatchCursorPagination
+from .services import (
+    FREELANCER_SUMMARY_FIELDS,
+    PROJECT_SUMMARY_FIELDS,
+    freelancer_summary,
+    load_freelancer_for_matching,
+    match_freelancer_projects,
+    match_project_freelancers,
+    match_projects,
+    project_summary,
+)
 
 
 def _weights_from_request(request):
@@ -36,108 +52,259 @@ def _top_n_from_request(request, default=20):
         return default
 
 
+def _project_ids_from_request(request, limit=100):
+    payload = request.data if isinstance(request.data, dict) else {}
+    raw_ids = payload.get("project_ids")
+    if not isinstance(raw_ids, list):
+        return None
+    try:
+        project_ids = list(dict.fromkeys(int(pid) for pid in raw_ids))
+    except (TypeError, ValueError):
+        return None
+    if not project_ids or len(project_ids) > limit:
+        return None
+    return project_ids
+
+
+def _timed_response(endpoint, timer, payload):
+    stats.record(endpoint, timer)
+    response = Response(payload)
+    if settings.MATCHING_SERVER_TIMING:
+        response["Server-Timing"] = timer.server_timing()
+    return response
+
+
+def _can_match_project(user, project):
+    if user.is_staff:
+        return True
+    return user.role == user.Role.CLIENT and project.client_id == user.client_profile.id
+
+
+def _can_match_freelancer(user, freelancer):
+    if user.is_staff:
+        return True
+    return user.role == user.Role.FREELANCER and freelancer.user_id == user.id
+
+
+def _job_payload(request, job):
+    payload = {
+        "job_id": job.id,
+        "kind": job.kind,
+        "target_id": job.target_id,
+        "status": job.status,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "url": request.build_absolute_uri(reverse("match-job", args=[job.id])),
+    }
+    if job.status == MatchJob.Status.DONE:
+        payload["result"] = job.result
+    elif job.status == MatchJob.Status.FAILED:
+        payload["detail"] = "Match job failed"
+    return payload
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def match_project(request, project_id):
     project = get_object_or_404(Project, id=project_id)
-    user = request.user
+    if not _can_match_project(request.user, project):
+        return Response({"detail": "Forbidden"}, status=403)
+
+    timer = StageTimer()
+    weights = _weights_from_request(request)
+    top_n = _top_n_from_request(request)
+    matches = cached_matches(
+        "project",
+        project.id,
+        weights,
+        top_n,
+        lambda: match_project_freelancers(project, weights=weights, top_n=top_n, timer=timer),
+        timer=timer,
+    )
+    return _timed_response("match_project", timer, {"project_id": project_id, "matches": matches})
 
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def match_projects_batch(request):
+    project_ids = _project_ids_from_request(request)
+    if project_ids is None:
+        return Response({"detail": "project_ids must be a list of 1-100 ids"}, status=400)
+
+    projects = list(Project.objects.filter(id__in=project_ids).order_by("id"))
+    if len(projects) != len(project_ids):
+        return Response({"detail": "Project not found"}, status=404)
+
+    user = request.user
     if not user.is_staff:
-        if user.role != user.Role.CLIENT or project.client != user.client_profile:
+        if user.role != user.Role.CLIENT or any(
+            p.client_id != user.client_profile.id for p in projects
+        ):
             return Response({"detail": "Forbidden"}, status=403)
 
-    freelancers = (
-        FreelancerProfile.objects.select_related("user", "resume")
-        .prefetch_related(
-            "resume__experiences",
-            "resume__education",
-            "resume__certifications",
-            "resume__links",
-        )
-        .all()
+    timer = StageTimer()
+    results = match_projects(
+        projects,
+        weights=_weights_from_request(request),
+        top_n=_top_n_from_request(request),
+        timer=timer,
+    )
+    return _timed_response(
+        "match_projects",
+        timer,
+        {
+            "results": [
+                {"project_id": project_id, "matches": matches}
+                for project_id, matches in results.items()
+            ]
+        },
     )
-    engine = MatchingEngine()
-    weights = _weights_from_request(request)
-    top_n = _top_n_from_request(request)
-    matches = engine.match_project_to_freelancers(project, freelancers, weights=weights, top_n=top_n)
-
-    freelancer_map = {f.id: f for f in freelancers}
-
-    for item in matches:
-        freelancer = freelancer_map.get(item["freelancer_id"])
-        if freelancer:
-            item["freelancer"] = {
-                "id": freelancer.id,
-                "name": freelancer.name,
-                "experience_level": freelancer.experience_level,
-                "hourly_rate": freelancer.hourly_rate,
-                "rating": freelancer.rating,
-                "skills": freelancer.skills,
-            }
-
-        Match.objects.update_or_create(
-            project=project,
-            freelancer_id=item["freelancer_id"],
-            defaults={
-                "match_score": item["score"],
-                "matched_skills": item["matched_skills"],
-            },
-        )
-
-    return Response({"project_id": project_id, "matches": matches})
 
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def match_freelancer(request, freelancer_id):
-    freelancer = (
-        FreelancerProfile.objects.select_related("resume")
-        .prefetch_related(
-            "resume__experiences",
-            "resume__education",
-            "resume__certifications",
-            "resume__links",
-        )
-        .filter(id=freelancer_id)
-        .first()
-    )
+    timer = StageTimer()
+    with timer.stage("load_freelancer"):
+        freelancer = load_freelancer_for_matching(freelancer_id)
     if not freelancer:
         return Response({"detail": "Freelancer not found"}, status=404)
-    user = request.user
+    if not _can_match_freelancer(request.user, freelancer):
+        return Response({"detail": "Forbidden"}, status=403)
 
-    if not user.is_staff:
-        if user.role != user.Role.FREELANCER or freelancer.user_id != user.id:
-            return Response({"detail": "Forbidden"}, status=403)
-
-    projects = Project.objects.filter(status=Project.Status.OPEN)
-    engine = MatchingEngine()
     weights = _weights_from_request(request)
     top_n = _top_n_from_request(request)
-    matches = engine.match_freelancer_to_projects(
-        freelancer, list(projects), weights=weights, top_n=top_n
+    matches = cached_matches(
+        "freelancer",
+        freelancer.id,
+        weights,
+        top_n,
+        lambda: match_freelancer_projects(freelancer, weights=weights, top_n=top_n, timer=timer),
+        timer=timer,
+    )
+    return _timed_response(
+        "match_freelancer", timer, {"freelancer_id": freelancer_id, "matches": matches}
     )
 
-    project_map = {p.id: p for p in projects}
-
-    for item in matches:
-        project = project_map.get(item["project_id"])
-        if project:
-            item["project"] = {
-                "id": project.id,
-                "title": project.title,
-                "budget_min": project.budget_min,
-                "budget_max": project.budget_max,
-                "category": project.category,
-                "required_skills": project.required_skills,
-            }
-
-        Match.objects.update_or_create(
-            project_id=item["project_id"],
-            freelancer=freelancer,
-            defaults={
-                "match_score": item["score"],
-                "matched_skills": item["matched_skills"],
-            },
-        )
-
-    return Response({"freelancer_id": freelancer_id, "matches": matches})
+
+def _stored_matches_response(request, matches, item):
+    paginator = MatchCursorPagination()
+    page = paginator.paginate_queryset(matches, request)
+    return paginator.get_paginated_response([item(match) for match in page])
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def project_matches(request, project_id):
+    project = get_object_or_404(Project, id=project_id)
+    if not _can_match_project(request.user, project):
+        return Response({"detail": "Forbidden"}, status=403)
+
+    matches = Match.objects.filter(source=Match.Source.PROJECT, project=project)
+    matches = matches.select_related("freelancer").only(
+        "id",
+        "match_score",
+        "matched_skills",
+        "calculated_at",
+        *(f"freelancer__{field}" for field in FREELANCER_SUMMARY_FIELDS),
+    )
+    return _stored_matches_response(
+        request,
+        matches,
+        lambda match: {
+            "freelancer_id": match.freelancer_id,
+            "score": match.match_score,
+            "matched_skills": match.matched_skills,
+            "calculated_at": match.calculated_at,
+            "freelancer": freelancer_summary(match.freelancer),
+        },
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def freelancer_matches(request, freelancer_id):
+    freelancer = get_object_or_404(FreelancerProfile, id=freelancer_id)
+    if not _can_match_freelancer(request.user, freelancer):
+        return Response({"detail": "Forbidden"}, status=403)
+
+    matches = Match.objects.filter(source=Match.Source.FREELANCER, freelancer=freelancer)
+    matches = matches.select_related("project").only(
+        "id",
+        "match_score",
+        "matched_skills",
+        "calculated_at",
+        *(f"project__{field}" for field in PROJECT_SUMMARY_FIELDS),
+    )
+    return _stored_matches_response(
+        request,
+        matches,
+        lambda match: {
+            "project_id": match.project_id,
+            "score": match.match_score,
+            "matched_skills": match.matched_skills,
+            "calculated_at": match.calculated_at,
+            "project": project_summary(match.project),
+        },
+    )
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def match_project_async(request, project_id):
+    project = get_object_or_404(Project, id=project_id)
+    if not _can_match_project(request.user, project):
+        return Response({"detail": "Forbidden"}, status=403)
+
+    job = submit(
+        MatchJob.Kind.PROJECT,
+        project.id,
+        request.user,
+        weights=_weights_from_request(request),
+        top_n=_top_n_from_request(request),
+    )
+    return Response(_job_payload(request, job), status=202)
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def match_freelancer_async(request, freelancer_id):
+    freelancer = get_object_or_404(FreelancerProfile, id=freelancer_id)
+    if not _can_match_freelancer(request.user, freelancer):
+        return Response({"detail": "Forbidden"}, status=403)
+
+    job = submit(
+        MatchJob.Kind.FREELANCER,
+        freelancer.id,
+        request.user,
+        weights=_weights_from_request(request),
+        top_n=_top_n_from_request(request),
+    )
+    return Response(_job_payload(request, job), status=202)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def match_job(request, job_id):
+    jobs = MatchJob.objects.filter(requested_by__isnull=False)
+    if not request.user.is_staff:
+        jobs = jobs.filter(requested_by=request.user)
+    job = get_object_or_404(jobs, id=job_id)
+    return Response(_job_payload(request, job))
+
+
+@api_view(["POST"])
+@permission_classes([IsAdminUser])
+def rebuild_index(request):
+    index = rebuild_freelancer_index()
+    bump_corpus_version()
+    return Response(
+        {"documents": len(index), "terms": len(index.vectorizer.vocabulary_)}
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def match_stats(request):
+    return Response(stats.snapshot())
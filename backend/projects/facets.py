@@ -0,0 +1,93 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from skillsync.cache import bump_cache_version, cache_version
+from .models import Project, ProjectSkill
+
+FACETS_VERSION_KEY = "projects:facets-version"
+# Pagination parameters do not change the filtered set.
+IGNORED_PARAMS = {"cursor", "page_size", "format"}
+SKILL_FACET_LIMIT = 50
+# (key, min inclusive, max exclusive) on budget_max.
+BUDGET_BUCKETS = [
+    ("under_1000", None, 1000),
+    ("1000_5000", 1000, 5000),
+    ("5000_10000", 5000, 10000),
+    ("10000_plus", 10000, None),
+]
+
+
+def facets_version():
+    return cache_version(FACETS_VERSION_KEY)
+
+
+def bump_facets_version():
+    bump_cache_version(FACETS_VERSION_KEY)
+
+
+def facets_cache_key(scope, params):
+    items = sorted(
+        (name, value)
+        for name, values in params.lists()
+        if name not in IGNORED_PARAMS
+        for value in values
+    )
+    digest = hashlib.sha1(urlencode(items).encode("utf-8")).hexdigest()
+    return f"projects:facets:{facets_version()}:{scope}:{digest}"
+
+
+def _bucket_filter(low, high):
+    condition = Q()
+    if low is not None:
+        condition &= Q(budget_max__gte=low)
+    if high is not None:
+        condition &= Q(budget_max__lt=high)
+    return condition
+
+
+def compute_facets(queryset):
+    """Category, skill and budget counts for ``queryset`` in three aggregate queries."""
+    # Filtering by id drops the search ranking annotations and ordering from the GROUP BYs.
+    projects = Project.objects.filter(id__in=queryset.order_by().values("id"))
+
+    budget = projects.aggregate(
+        total=Count("id"),
+        **{key: Count("id", filter=_bucket_filter(low, high)) for key, low, high in BUDGET_BUCKETS},
+    )
+    categories = (
+        projects.values("category")
+        .annotate(count=Count("id"))
+        .order_by("-count", "category")
+    )
+    skills = (
+        ProjectSkill.objects.filter(project__in=projects)
+        .values("skill__name")
+        .annotate(count=Count("id"))
+        .order_by("-count", "skill__name")[:SKILL_FACET_LIMIT]
+    )
+    return {
+        "total": budget["total"],
+        "categories": [{"value": row["category"], "count": row["count"]} for row in categories],
+        "skills": [{"value": row["skill__name"], "count": row["count"]} for row in skills],
+        "budget": [
+            {"key": key, "min": low, "max": high, "count": budget[key]}
+            for key, low, high in BUDGET_BUCKETS
+        ],
+    }
+
+
+def cached_facets(scope, params, queryset):
+    timeout = settings.PROJECT_FACETS_CACHE_TTL
+    if not timeout:
+        return compute_facets(queryset)
+
+    key = facets_cache_key(scope, params)
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_facets(queryset)
+        cache.set(key, facets, timeout)
+    return facets
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from projects.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the project full-text search index, e.g. after bulk imports that skip model signals."
+
+    def handle(self, *args, **options):
+        get_search_backend().rebuild()
+        self.stdout.write(self.style.SUCCESS("Rebuilt the project search index."))
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:40
+
+from django.db import migrations
+
+# Frozen copies of the SQL in projects.search, so later edits there cannot change history.
+POSTGRES_FORWARD = [
+    "ALTER TABLE projects_project ADD COLUMN search_vector tsvector",
+    "UPDATE projects_project SET search_vector = "
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+    "CREATE INDEX projects_project_search_idx ON projects_project USING GIN (search_vector)",
+]
+POSTGRES_REVERSE = ["ALTER TABLE projects_project DROP COLUMN search_vector"]
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE projects_project_fts USING fts5("
+    "title, description, tokenize='porter unicode61')",
+    "INSERT INTO projects_project_fts (rowid, title, description) "
+    "SELECT id, title, description FROM projects_project",
+]
+SQLITE_REVERSE = ["DROP TABLE IF EXISTS projects_project_fts"]
+
+FORWARD = {"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}
+REVERSE = {"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}
+
+
+def create_search_index(apps, schema_editor):
+    for sql in FORWARD.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    for sql in REVERSE.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
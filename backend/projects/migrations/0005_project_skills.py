@@ -0,0 +1,52 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_project_skills(apps, schema_editor):
+    Skill = apps.get_model('accounts', 'Skill')
+    Project = apps.get_model('projects', 'Project')
+    Link = apps.get_model('projects', 'ProjectSkill')
+    rows = list(Project.objects.values_list('id', 'normalized_skills'))
+    # Skills longer than Skill.name allows were never length-checked; they get no link.
+    names = {name for _, skills in rows for name in skills if len(name) <= 100}
+    Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+    skill_ids = dict(Skill.objects.values_list('name', 'id'))
+    Link.objects.bulk_create(
+        [
+            Link(project_id=owner_id, skill_id=skill_ids[name])
+            for owner_id, skills in rows
+            for name in set(skills)
+            if name in names
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_skills'),
+        ('projects', '0004_project_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_links', to='projects.project')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_links', to='accounts.skill')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'project'], name='project_skill_lookup_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='projectskill',
+            constraint=models.UniqueConstraint(fields=('project', 'skill'), name='unique_project_skill'),
+        ),
+        migrations.RunPython(backfill_project_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-17 14:47
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_project_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['client', '-created_at', '-id'], name='project_client_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(django.db.models.functions.text.Lower('category'), models.OrderBy(models.F('created_at'), descending=True), models.OrderBy(models.F('id'), descending=True), name='project_category_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['budget_min'], name='project_budget_min_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['budget_max'], name='project_budget_max_idx'),
+        ),
+    ]
@@ -1,5 +1,8 @@
-from django.db import models
-from accounts.models import ClientProfile
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.functions import Lower
+from accounts.models import ClientProfile, Skill, sync_skill_links
+from matching.skills import normalize_skills
 
 
 class Project(models.Model):
@@ -11,12 +14,56 @@ class Project(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField()
     required_skills = models.JSONField(default=list, blank=True)
+    normalized_skills = models.JSONField(default=list, blank=True, editable=False)
     budget_min = models.DecimalField(max_digits=10, decimal_places=2)
     budget_max = models.DecimalField(max_digits=10, decimal_places=2)
     deadline = models.DateField(null=True, blank=True)
     category = models.CharField(max_length=255, blank=True)
     status = models.CharField(max_length=10, choices=Status.choices, default=Status.OPEN)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            # Keyset pagination walks (created_at, id) newest first; freelancers only see open ones.
+            models.Index(fields=["-created_at", "-id"], name="project_created_idx"),
+            models.Index(fields=["status", "-created_at", "-id"], name="project_status_created_idx"),
+            models.Index(fields=["client", "-created_at", "-id"], name="project_client_created_idx"),
+            # The list view filters category case-insensitively as LOWER(category) = LOWER(%s).
+            models.Index(
+                Lower("category"),
+                F("created_at").desc(),
+                F("id").desc(),
+                name="project_category_created_idx",
+            ),
+            models.Index(fields=["budget_min"], name="project_budget_min_idx"),
+            models.Index(fields=["budget_max"], name="project_budget_max_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.normalized_skills = normalize_skills(self.required_skills)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            extra = {"updated_at"}
+            if "required_skills" in update_fields:
+                extra.add("normalized_skills")
+            kwargs["update_fields"] = {*update_fields, *extra}
+        # One transaction, so on_commit hooks (facet and match invalidation) see the skill links.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if update_fields is None or "required_skills" in update_fields:
+                sync_skill_links(ProjectSkill, "project_id", self.pk, self.normalized_skills)
 
     def __str__(self):
         return self.title
+
+
+class ProjectSkill(models.Model):
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="skill_links")
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="project_links")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["project", "skill"], name="unique_project_skill")
+        ]
+        indexes = [models.Index(fields=["skill", "project"], name="project_skill_lookup_idx")]
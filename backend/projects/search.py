@@ -0,0 +1,154 @@
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+SQLITE_FTS_TABLE = "projects_project_fts"
+
+
+class BasicSearch:
+    """Unranked substring match, for databases without a full-text backend."""
+
+    # Keyset pagination sort key for search results.
+    rank_ordering = "-created_at"
+
+    def index(self, project_ids):
+        pass
+
+    def remove(self, project_ids):
+        pass
+
+    def rebuild(self):
+        pass
+
+    def search(self, queryset, query):
+        matches = Q(title__icontains=query) | Q(description__icontains=query)
+        return queryset.filter(matches).order_by("-created_at")
+
+
+class PostgresSearch(BasicSearch):
+    """Weighted ``tsvector`` column (title A, description B) behind a GIN index."""
+
+    rank_ordering = "-search_rank"
+
+    vector_sql = (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+    )
+
+    def index(self, project_ids):
+        if not project_ids:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE projects_project SET search_vector = {self.vector_sql} WHERE id = ANY(%s)",
+                [list(project_ids)],
+            )
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"UPDATE projects_project SET search_vector = {self.vector_sql}")
+
+    def search(self, queryset, query):
+        tsquery = "websearch_to_tsquery('english', %s)"
+        return (
+            queryset.alias(
+                search_match=RawSQL(
+                    f"projects_project.search_vector @@ {tsquery}",
+                    [query],
+                    output_field=BooleanField(),
+                )
+            )
+            .annotate(
+                search_rank=RawSQL(
+                    f"ts_rank(projects_project.search_vector, {tsquery})",
+                    [query],
+                    output_field=FloatField(),
+                ),
+            )
+            .filter(search_match=True)
+            .order_by("-search_rank", "-created_at")
+        )
+
+
+class SQLiteSearch(BasicSearch):
+    """FTS5 table keyed by project id, ranked with bm25 (title weighted over description)."""
+
+    # bm25 scores are negative; more negative is more relevant.
+    rank_ordering = "search_rank"
+
+    def _insert(self, execute, where, params=()):
+        execute(
+            f"INSERT INTO {SQLITE_FTS_TABLE} (rowid, title, description) "
+            f"SELECT id, title, description FROM projects_project {where}",
+            params,
+        )
+
+    def _ids_clause(self, project_ids):
+        return ", ".join("%s" for _ in project_ids)
+
+    def index(self, project_ids):
+        project_ids = list(project_ids)
+        if not project_ids:
+            return
+        placeholders = self._ids_clause(project_ids)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid IN ({placeholders})", project_ids
+            )
+            self._insert(cursor.execute, f"WHERE id IN ({placeholders})", project_ids)
+
+    def remove(self, project_ids):
+        project_ids = list(project_ids)
+        if not project_ids:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid IN ({self._ids_clause(project_ids)})",
+                project_ids,
+            )
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SQLITE_FTS_TABLE}")
+            self._insert(cursor.execute, "")
+
+    def search(self, queryset, query):
+        # Quote each term so user input can never be parsed as FTS5 syntax; * allows prefixes.
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            # Keyset pagination still orders by search_rank, so the empty result needs it too.
+            return queryset.none().annotate(search_rank=Value(0.0, output_field=FloatField()))
+        match = " ".join(f'"{term}"*' for term in terms)
+        return (
+            queryset.filter(
+                id__in=RawSQL(
+                    f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s",
+                    [match],
+                )
+            )
+            .annotate(
+                search_rank=RawSQL(
+                    f"SELECT bm25({SQLITE_FTS_TABLE}, 10.0, 1.0) FROM {SQLITE_FTS_TABLE} "
+                    f"WHERE {SQLITE_FTS_TABLE} MATCH %s AND rowid = projects_project.id",
+                    [match],
+                    output_field=FloatField(),
+                )
+            )
+            .order_by("search_rank", "-created_at")
+        )
+
+
+BACKENDS = {
+    "postgresql": PostgresSearch,
+    "sqlite": SQLiteSearch,
+}
+
+
+def get_search_backend(vendor=None):
+    return BACKENDS.get(vendor or connection.vendor, BasicSearch)()
+
+
+def search_projects(queryset, query):
+    return get_search_backend().search(queryset, query)
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from accounts.models import SKILL_NAME_MAX_LENGTH
 from .models import Project
 
 
@@ -30,4 +31,9 @@ class ProjectSerializer(serializers.ModelSerializer):
             return []
         if isinstance(value, str):
             value = value.split(",")
-        return [str(skill).strip().lower() for skill in value if str(skill).strip()]
+        skills = [str(skill).strip().lower() for skill in value if str(skill).strip()]
+        if any(len(skill) > SKILL_NAME_MAX_LENGTH for skill in skills):
+            raise serializers.ValidationError(
+                f"Each skill must be at most {SKILL_NAME_MAX_LENGTH} characters."
+            )
+        return skills
@@ -0,0 +1,21 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .facets import bump_facets_version
+from .models import Project
+from .search import get_search_backend
+
+
+@receiver(post_save, sender=Project)
+def project_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    get_search_backend().index([instance.pk])
+    transaction.on_commit(bump_facets_version)
+
+
+@receiver(post_delete, sender=Project)
+def project_deleted(sender, instance, **kwargs):
+    get_search_backend().remove([instance.pk])
+    transaction.on_commit(bump_facets_version)
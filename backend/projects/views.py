@@ -1,13 +1,31 @@
-from django.db.models import Q
+from functools import partial
+
+from django.db.models import Value
+from django.db.models.functions import Lower
 from rest_framework import permissions, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
-from .models import Project
+from rest_framework.response import Response
+from accounts.models import filter_by_skills
+from matching.jobs import enqueue_project_change_on_commit
+from matching.skills import normalize_skills
+from skillsync.conditional import conditional_get
+from .facets import cached_facets
+from .models import Project, ProjectSkill
+from skillsync.pagination import KeysetPagination
+from .search import get_search_backend, search_projects
 from .serializers import ProjectSerializer
 
 
 class ProjectViewSet(viewsets.ModelViewSet):
     serializer_class = ProjectSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    def get_keyset_ordering(self):
+        if self.request.query_params.get("q"):
+            return get_search_backend().rank_ordering
+        return "-created_at"
 
     def get_queryset(self):
         user = self.request.user
@@ -26,7 +44,10 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
         category = params.get("category")
         if category:
-            qs = qs.filter(category__iexact=category)
+            # iexact compiles to UPPER()/LIKE, which cannot use the LOWER(category) index.
+            qs = qs.alias(category_lower=Lower("category")).filter(
+                category_lower=Lower(Value(category))
+            )
 
         budget_min = params.get("budget_min")
         budget_max = params.get("budget_max")
@@ -37,27 +58,80 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
         skills = params.get("skills")
         if skills:
-            for skill in [s.strip().lower() for s in skills.split(",") if s.strip()]:
-                qs = qs.filter(required_skills__contains=[skill])
+            match = "any" if params.get("skills_match") == "any" else "all"
+            qs = filter_by_skills(
+                qs, ProjectSkill, "project_id", normalize_skills(skills.split(",")), match=match
+            )
 
         query = params.get("q")
         if query:
-            qs = qs.filter(Q(title__icontains=query) | Q(description__icontains=query))
+            # Ranked by relevance rather than recency.
+            return search_projects(qs, query)
 
         return qs.order_by("-created_at")
 
+    def list(self, request, *args, **kwargs):
+        # The page query runs anyway, so its rows are the validators: ids catch inserts and
+        # deletions within the page, the links catch the page edges moving, and the client
+        # timestamp covers the embedded client name/company. Only serialization is skipped.
+        page = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        stamps = [(project.id, project.updated_at, project.client.updated_at) for project in page]
+        links = (self.paginator.get_next_link(), self.paginator.get_previous_link())
+        last_modified = max((max(updated) for _, *updated in stamps), default=None)
+        return conditional_get(
+            request,
+            ("projects", request.user.pk, request.get_full_path(), stamps, links),
+            last_modified,
+            lambda: self.get_paginated_response(self.get_serializer(page, many=True).data),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        try:
+            stamps = (
+                self.get_queryset()
+                .filter(**{self.lookup_field: lookup})
+                .values_list("updated_at", "client__updated_at")
+                .first()
+            )
+        except (TypeError, ValueError):
+            stamps = None
+        if stamps is None:
+            # Let the normal lookup produce the 404.
+            return super().retrieve(request, *args, **kwargs)
+        return conditional_get(
+            request,
+            ("project", lookup, stamps),
+            max(stamps),
+            partial(super().retrieve, request, *args, **kwargs),
+        )
+
+    @action(detail=False, methods=["get"])
+    def facets(self, request):
+        user = request.user
+        # Everyone sharing a visibility scope shares cached counts.
+        if user.is_staff:
+            scope = "all"
+        elif user.role == user.Role.CLIENT:
+            scope = f"client:{user.client_profile.id}"
+        else:
+            scope = "open"
+        return Response(cached_facets(scope, request.query_params, self.get_queryset()))
+
     def perform_create(self, serializer):
         user = self.request.user
         if user.role != user.Role.CLIENT:
             raise PermissionDenied("Only clients can create projects")
-        serializer.save(client=user.client_profile)
+        project = serializer.save(client=user.client_profile)
+        enqueue_project_change_on_commit(project.id)
 
     def perform_update(self, serializer):
         project = self.get_object()
         user = self.request.user
         if not user.is_staff and (user.role != user.Role.CLIENT or project.client != user.client_profile):
             raise PermissionDenied("You cannot update this project")
-        serializer.save()
+        project = serializer.save()
+        enqueue_project_change_on_commit(project.id)
 
     def perform_destroy(self, instance):
         user = self.request.user
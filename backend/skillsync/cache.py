@@ -0,0 +1,20 @@
+import time
+
+from django.core.cache import cache
+
+
+def cache_version(key):
+    """Current value of the invalidation counter stored under ``key``."""
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so an evicted counter never reuses an old version.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
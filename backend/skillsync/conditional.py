@@ -0,0 +1,26 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def conditional_get(request, validators, last_modified, respond):
+    """Answer a GET with ``304 Not Modified`` when the client's copy is current.
+
+    ``validators`` is any repr-able value that changes whenever the payload
+    would; it is hashed into the ETag. ``respond`` builds the full response
+    and is only called when the client's copy is stale, so serializers are
+    skipped on a match.
+    """
+    etag = quote_etag(hashlib.sha1(repr(validators).encode("utf-8")).hexdigest())
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        response = respond()
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        # Per-user payloads: browsers may keep them but must revalidate every time.
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
